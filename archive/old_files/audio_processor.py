@@ -6,19 +6,108 @@ Implements professional VAD, filtering, and transmission detection
 import numpy as np
 import soundfile as sf
 from scipy import signal
-from scipy.signal import butter, filtfilt, resample
+from scipy.signal import butter, sosfiltfilt, resample, resample_poly
+import concurrent.futures
 import io
 import logging
+import os
 from pydub import AudioSegment
 from typing import Tuple, List, Optional, Dict, Any
 import time
 import threading
+from collections import deque
+from fractions import Fraction
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain NumPy
+    njit = None
+
+try:
+    import miniaudio
+except ImportError:  # miniaudio is optional - fall back to pydub/ffmpeg
+    miniaudio = None
+
+
+def _zcr_numpy(frame):
+    """Zero-crossing rate of a frame (NumPy fallback)
+
+    Sign changes are detected by comparing sign bits, which is branchless
+    and avoids the three intermediates of diff(sign(frame)). Exact zeros
+    count as positive (np.sign mapped them to 0), an immaterial difference
+    for real radio audio. Scaled by 2/len to match the historical
+    sum(abs(diff(sign)))/len formulation the thresholds were tuned on.
+    """
+    signs = np.signbit(frame)
+    return 2.0 * np.count_nonzero(signs[1:] != signs[:-1]) / len(frame)
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _zcr(frame):
+        """Single-pass ZCR kernel (no temporaries)
+
+        Scaled by 2/len to match the historical sum(abs(diff(sign)))/len
+        formulation the thresholds were tuned on.
+        """
+        crossings = 0
+        prev = frame[0] < 0
+        for i in range(1, frame.shape[0]):
+            neg = frame[i] < 0
+            if neg != prev:
+                crossings += 1
+            prev = neg
+        return 2.0 * crossings / frame.shape[0]
+else:
+    _zcr = _zcr_numpy
+
+
+def _distribution_stats(values: deque) -> Dict[str, float]:
+    """Summary statistics for a metric sample deque
+
+    fromiter reads the deque straight into an array without an intermediate
+    list, and a single np.partition places all three percentile ranks in one
+    O(N) pass instead of three sorts. Nearest-rank percentiles (no
+    interpolation) are plenty for threshold tuning.
+    """
+    arr = np.fromiter(values, dtype=np.float64, count=len(values))
+    n = len(arr)
+    ranks = [int(0.25 * (n - 1)), int(0.75 * (n - 1)), int(0.95 * (n - 1))]
+    part = np.partition(arr, ranks)
+    return {
+        'mean': float(arr.mean()),
+        'std': float(arr.std()),
+        'min': float(arr.min()),
+        'max': float(arr.max()),
+        'percentile_25': float(part[ranks[0]]),
+        'percentile_75': float(part[ranks[1]]),
+        'percentile_95': float(part[ranks[2]])
+    }
+
+
 class AudioProcessor:
     """Advanced audio processing with VAD, filtering, and transmission detection"""
-    
+
+    # One process-wide DSP pool shared by every channel's processor, so N
+    # channels don't spawn N pools and oversubscribe the CPU. SciPy's filter
+    # and resample kernels release the GIL, so channels genuinely run in
+    # parallel on it.
+    _dsp_pool = None
+    _dsp_pool_lock = threading.Lock()
+
+    @classmethod
+    def _get_dsp_pool(cls):
+        """Lazily create the shared preprocessing thread pool"""
+        if cls._dsp_pool is None:
+            with cls._dsp_pool_lock:
+                if cls._dsp_pool is None:
+                    cls._dsp_pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=os.cpu_count() or 2,
+                        thread_name_prefix='audio-dsp')
+        return cls._dsp_pool
+
     def __init__(self, config=None, channel_config=None):
         """Initialize the audio processor with configuration"""
         self.config = config or {}
@@ -54,19 +143,22 @@ class AudioProcessor:
         self.metrics = {
             'frames_processed': 0,
             'speech_frames': 0,
-            'energy_values': [],
-            'zcr_values': [],
+            'energy_values': deque(maxlen=1000),
+            'zcr_values': deque(maxlen=1000),
             'transmissions_started': 0,
             'transmissions_completed': 0,
             'transmissions_discarded': 0,
-            'transmission_durations': [],
+            'transmission_durations': deque(maxlen=100),
             'false_positives': 0,  # Short discarded transmissions
             'last_reset': time.time(),
             'energy_threshold': 0,  # Current threshold
             'zcr_min': 0,           # Current threshold
             'zcr_max': 0            # Current threshold
         }
-        
+        # get_metrics snapshot cache keyed on frames_processed: repeated polls
+        # between frames return the same dict without recomputing statistics
+        self._metrics_cache = (-1, None)
+
         # VAD thresholds - channel-specific
         self.energy_threshold = vad_config.get('energy_threshold', 8e-6)  # Default stricter threshold
         self.zcr_min = vad_config.get('zcr_min', 0.08)  # Default ZCR minimum
@@ -75,12 +167,59 @@ class AudioProcessor:
         # Transmission length limits - channel-specific
         self.min_transmission_ms = vad_config.get('min_transmission_ms', 
                                                 self.config.get('min_transmission_ms', 2000))  # Default 2.0s minimum
-        self.max_transmission_ms = vad_config.get('max_transmission_ms', 
+        self.max_transmission_ms = vad_config.get('max_transmission_ms',
                                                 self.config.get('max_transmission_ms', 30000)) # Default 30s maximum
+        # Length limits in samples, so the per-frame end-of-transmission check
+        # compares integers instead of converting to ms every time
+        self._min_tx_samples = int(self.min_transmission_ms * self.target_sample_rate / 1000)
+        self._max_tx_samples = int(self.max_transmission_ms * self.target_sample_rate / 1000)
         
+        # Design filters once - sample rate and cutoffs are fixed for the processor's
+        # lifetime. Second-order sections are numerically stabler than b/a transfer
+        # functions, and stacking the HP and LP sections into one cascade lets a
+        # single sosfiltfilt pass do the whole bandpass.
+        self._bandpass_sos = None
+        sos_sections = []
+        nyquist = self.target_sample_rate / 2
+        if self.highpass_freq > 0:
+            high_normalized = self.highpass_freq / nyquist
+            if high_normalized < 0.99:  # Valid frequency range
+                sos_sections.append(butter(2, high_normalized, btype='high', output='sos'))
+        if self.lowpass_freq > 0:
+            low_normalized = self.lowpass_freq / nyquist
+            if low_normalized < 0.99:  # Valid frequency range
+                sos_sections.append(butter(2, low_normalized, btype='low', output='sos'))
+        if sos_sections:
+            self._bandpass_sos = np.vstack(sos_sections)
+
+        # Preallocated transmission buffer - avoids boxing every sample into a
+        # Python list per frame and the final list->array copy at completion.
+        # Sized so preroll plus the frame that trips the max-length check still
+        # fit; anything longer is over max_transmission_ms and gets discarded.
+        self._tx_capacity = (int(self.max_transmission_ms / 1000 * self.target_sample_rate)
+                             + int(self.preroll_ms / 1000 * self.target_sample_rate)
+                             + self.frame_size)
+        self._tx_buf = np.empty(self._tx_capacity, dtype=np.float32)
+        self._tx_len = 0
+
+        # Preroll kept in a contiguous ring buffer: O(1) push per frame (at most
+        # two slice writes on wrap) instead of list append plus O(n) pop(0),
+        # with no per-frame array copies kept alive
+        self._preroll_samples = max(1, int(self.preroll_ms / 1000 * self.target_sample_rate))
+        self._preroll = np.zeros(self._preroll_samples, dtype=np.float32)
+        self._preroll_head = 0
+        self._preroll_fill = 0
+
+        # Cache of (up, down) polyphase ratios keyed by source sample rate
+        self._resample_ratios = {}
+
+        # STFT analysis window for the spectral-gate denoiser, built once
+        # (512-sample Hann with 75% overlap at 16kHz = 32ms frames, 8ms hop)
+        self._stft_nperseg = 512
+        self._stft_noverlap = 384
+        self._stft_window = signal.get_window('hann', self._stft_nperseg)
+
         # Internal state
-        self.preroll_buffer = []
-        self.current_transmission = None
         self.speech_frame_count = 0
         self.hang_time_frames = int(self.hang_time_ms / self.frame_duration_ms)
         self.silence_frame_count = 0
@@ -94,15 +233,34 @@ class AudioProcessor:
     def decode_mp3_to_pcm(self, mp3_data: bytes) -> Tuple[np.ndarray, int]:
         """Decode MP3 to PCM in memory, downmix to mono"""
         try:
-            # Use pydub to decode MP3
+            if miniaudio is not None:
+                # In-process decode straight into a contiguous float32 buffer:
+                # no ffmpeg subprocess, no per-sample Python objects, already
+                # normalized to [-1, 1]
+                decoded = miniaudio.mp3_read_f32(mp3_data)
+                samples = np.asarray(decoded.samples, dtype=np.float32)
+                if decoded.nchannels > 1:
+                    samples = samples.reshape(-1, decoded.nchannels).mean(axis=1)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Decoded MP3: {len(samples)} samples at {decoded.sample_rate}Hz")
+                return samples, decoded.sample_rate
+
+            # Fall back to pydub (spawns ffmpeg) when miniaudio is unavailable
             audio_segment = AudioSegment.from_file(io.BytesIO(mp3_data), format="mp3")
             
             # Convert to mono
             if audio_segment.channels > 1:
                 audio_segment = audio_segment.set_channels(1)
             
-            # Convert to numpy array
-            samples = np.array(audio_segment.get_array_of_samples(), dtype=np.float32)
+            # Convert to numpy array: view pydub's raw bytes directly instead
+            # of boxing every sample through a Python array object; the
+            # astype produces the one float copy we actually need
+            int_dtype = {1: np.int8, 2: np.int16, 4: np.int32}.get(audio_segment.sample_width)
+            if int_dtype is not None:
+                samples = np.frombuffer(audio_segment.raw_data, dtype=int_dtype).astype(np.float32)
+            else:
+                samples = np.array(audio_segment.get_array_of_samples(), dtype=np.float32)
             
             # Normalize to [-1, 1] range
             if audio_segment.sample_width == 2:  # 16-bit
@@ -114,7 +272,8 @@ class AudioProcessor:
             
             original_sample_rate = audio_segment.frame_rate
             
-            logger.debug(f"Decoded MP3: {len(samples)} samples at {original_sample_rate}Hz")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Decoded MP3: {len(samples)} samples at {original_sample_rate}Hz")
             return samples, original_sample_rate
             
         except Exception as e:
@@ -127,12 +286,26 @@ class AudioProcessor:
             return audio
         
         try:
-            # Calculate new length
-            new_length = int(len(audio) * self.target_sample_rate / original_rate)
-            resampled = resample(audio, new_length)
-            
-            logger.debug(f"Resampled from {original_rate}Hz to {self.target_sample_rate}Hz")
-            return resampled
+            # Polyphase FIR resampling is streaming and O(N) vs the FFT-based
+            # resample(); common radio rates (44100/22050 -> 16000) reduce to
+            # small rational ratios. Cache the ratio per source rate.
+            ratio = self._resample_ratios.get(original_rate)
+            if ratio is None:
+                frac = Fraction(self.target_sample_rate, original_rate).limit_denominator(1000)
+                ratio = self._resample_ratios[original_rate] = (frac.numerator, frac.denominator)
+            up, down = ratio
+            if abs(up / down - self.target_sample_rate / original_rate) < 1e-9:
+                resampled = resample_poly(audio, up, down)
+            else:
+                # Irrational-ish ratio - fall back to the FFT method
+                new_length = int(len(audio) * self.target_sample_rate / original_rate)
+                resampled = resample(audio, new_length)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Resampled from {original_rate}Hz to {self.target_sample_rate}Hz")
+            # Keep PCM float32 end-to-end: half the memory traffic and twice
+            # the SIMD lanes of the float64 SciPy silently promotes to
+            return resampled.astype(np.float32, copy=False)
             
         except Exception as e:
             logger.error(f"Failed to resample audio: {e}")
@@ -144,23 +317,17 @@ class AudioProcessor:
             return audio
         
         try:
-            nyquist = self.target_sample_rate / 2
-            
-            # Design highpass filter (remove hum and CTCSS)
-            if self.highpass_freq > 0:
-                high_normalized = self.highpass_freq / nyquist
-                if high_normalized < 0.99:  # Valid frequency range
-                    b_high, a_high = butter(2, high_normalized, btype='high')
-                    audio = filtfilt(b_high, a_high, audio)
-            
-            # Design lowpass filter (speech band)
-            if self.lowpass_freq > 0:
-                low_normalized = self.lowpass_freq / nyquist
-                if low_normalized < 0.99:  # Valid frequency range
-                    b_low, a_low = butter(2, low_normalized, btype='low')
-                    audio = filtfilt(b_low, a_low, audio)
-            
-            logger.debug(f"Applied filters: HP={self.highpass_freq}Hz, LP={self.lowpass_freq}Hz")
+            # Single forward/backward pass through the combined highpass+lowpass
+            # cascade designed in __init__ (highpass removes hum and CTCSS,
+            # lowpass keeps the speech band)
+            if self._bandpass_sos is not None:
+                # sosfiltfilt promotes to float64; cast back so downstream
+                # stages keep float32 bandwidth (copy=False is a no-op if
+                # SciPy ever returns float32 directly)
+                audio = sosfiltfilt(self._bandpass_sos, audio).astype(np.float32, copy=False)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Applied filters: HP={self.highpass_freq}Hz, LP={self.lowpass_freq}Hz")
             return audio
             
         except Exception as e:
@@ -173,27 +340,35 @@ class AudioProcessor:
             return audio
         
         try:
-            # Simple spectral gate implementation
-            # This is a basic implementation - for production, consider RNNoise
-            
-            # Calculate noise floor from first 100ms (assumed to be silence/noise)
-            noise_samples = min(int(0.1 * self.target_sample_rate), len(audio) // 4)
-            noise_floor = np.std(audio[:noise_samples]) * 2.0  # Conservative noise threshold
-            
-            # Apply gentle gate
+            # Spectral gate over an STFT: gates per frequency bin rather than
+            # per sample, so broadband hiss is attenuated without chopping up
+            # speech. The 75% overlap amortizes each FFT over four hops.
+            # For production-grade results, consider RNNoise.
+            freqs, times, spec = signal.stft(audio, fs=self.target_sample_rate,
+                                             window=self._stft_window,
+                                             nperseg=self._stft_nperseg,
+                                             noverlap=self._stft_noverlap)
+            mag = np.abs(spec)
+
+            # Per-bin noise floor from the first 100ms (assumed silence/noise)
+            hop = self._stft_nperseg - self._stft_noverlap
+            noise_frames = max(1, int(0.1 * self.target_sample_rate / hop))
+            noise_floor = np.percentile(mag[:, :noise_frames], 20, axis=1)
+
+            # Gate: subtract the noise magnitude, never below the floor ratio
             gate_ratio = 0.1  # Reduce noise by 90%
-            mask = np.abs(audio) > noise_floor
-            
-            # Smooth the mask to avoid artifacts
-            kernel_size = int(self.target_sample_rate * 0.005)  # 5ms smoothing
-            if kernel_size > 1:
-                kernel = np.ones(kernel_size) / kernel_size
-                mask = np.convolve(mask.astype(float), kernel, mode='same') > 0.5
-            
-            # Apply gate
-            gated_audio = np.where(mask, audio, audio * gate_ratio)
-            
-            logger.debug(f"Applied denoise: noise_floor={noise_floor:.6f}")
+            gain = np.maximum(1.0 - noise_floor[:, np.newaxis] / np.maximum(mag, 1e-12),
+                              gate_ratio)
+            spec *= gain
+
+            _, gated_audio = signal.istft(spec, fs=self.target_sample_rate,
+                                          window=self._stft_window,
+                                          nperseg=self._stft_nperseg,
+                                          noverlap=self._stft_noverlap)
+            gated_audio = gated_audio[:len(audio)].astype(np.float32, copy=False)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Applied denoise: mean noise_floor={float(noise_floor.mean()):.6f}")
             return gated_audio
             
         except Exception as e:
@@ -219,13 +394,24 @@ class AudioProcessor:
                 # Limit gain to reasonable range (avoid extreme amplification)
                 gain = np.clip(gain, 0.1, 10.0)
                 
-                # Apply gain with soft limiting
-                gained_audio = audio * gain
-                
-                # Soft limiting to prevent clipping
-                gained_audio = np.tanh(gained_audio * 0.9) / 0.9
+                # Apply gain with soft limiting. Rational approximation of
+                # tanh(x): x*(27+x^2)/(27+9x^2) saturates toward +/-1 like tanh
+                # but costs a few multiply-adds instead of a libm call. Valid
+                # for |x| <= 3 (reaches exactly +/-1 at +/-3), so hard-clip the
+                # already-limited gain output there first. Stages run on arrays
+                # the size of the decoded chunk, so the arithmetic below uses
+                # in-place ops to keep it to two temporaries.
+                y = audio * gain
+                np.clip(y, -3.0, 3.0, out=y)
+                y2 = y * y
+                gained_audio = y2 + 27.0
+                gained_audio *= y
+                y2 *= 9.0
+                y2 += 27.0
+                gained_audio /= y2
                 
-                logger.debug(f"Applied AGC: gain={gain:.2f}, rms={rms:.6f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Applied AGC: gain={gain:.2f}, rms={rms:.6f}")
                 return gained_audio
             
             return audio
@@ -237,131 +423,167 @@ class AudioProcessor:
     def simple_vad(self, frame: np.ndarray) -> bool:
         """Simple energy-based VAD (fallback when WebRTC VAD is not available)"""
         try:
-            # Calculate energy metrics
-            energy = np.sum(frame**2)
-            zero_crossing_rate = np.sum(np.abs(np.diff(np.sign(frame)))) / len(frame)
-            
-            # Use channel-specific VAD thresholds
-            has_energy = energy > self.energy_threshold
-            has_speech_zcr = self.zcr_min < zero_crossing_rate < self.zcr_max
-            
-            is_speech = has_energy and has_speech_zcr
-            
-            # Collect metrics for auto-tuner
-            with self.metrics_lock:
-                self.metrics['frames_processed'] += 1
-                if is_speech:
-                    self.metrics['speech_frames'] += 1
-                
-                # Sample energy and ZCR values (keep last 1000 for memory efficiency)
-                self.metrics['energy_values'].append(energy)
-                self.metrics['zcr_values'].append(zero_crossing_rate)
-                if len(self.metrics['energy_values']) > 1000:
-                    self.metrics['energy_values'].pop(0)
-                if len(self.metrics['zcr_values']) > 1000:
-                    self.metrics['zcr_values'].pop(0)
-                
-                # Update current thresholds for reporting
-                self.metrics['energy_threshold'] = self.energy_threshold
-                self.metrics['zcr_min'] = self.zcr_min
-                self.metrics['zcr_max'] = self.zcr_max
+            # Energy first: radio channels are mostly silence, so frames well
+            # below threshold can skip the costlier ZCR entirely. The 0.25
+            # margin keeps near-threshold frames contributing real ZCR
+            # samples to the auto-tuner metrics.
+            # dot dispatches to BLAS: fused multiply-accumulate with no
+            # temporary array of squares (frames are float32 from decode, so
+            # single-precision SIMD lanes apply)
+            energy = float(np.dot(frame, frame))
+            if energy <= self.energy_threshold * 0.25:
+                is_speech = False
+                zero_crossing_rate = 0.0
+            else:
+                zero_crossing_rate = _zcr(frame)
+
+                # Use channel-specific VAD thresholds
+                has_energy = energy > self.energy_threshold
+                has_speech_zcr = self.zcr_min < zero_crossing_rate < self.zcr_max
+
+                is_speech = has_energy and has_speech_zcr
             
-            logger.debug(f"Channel VAD: energy={energy:.2e} (>{self.energy_threshold:.2e}), "
-                        f"zcr={zero_crossing_rate:.3f} ({self.zcr_min}-{self.zcr_max}), speech={is_speech}")
+            # Collect metrics for auto-tuner. Only the VAD thread writes these:
+            # int increments and deque appends are atomic under the GIL, so no
+            # lock is needed on the per-frame path; get_metrics snapshots under
+            # the lock instead.
+            self.metrics['frames_processed'] += 1
+            if is_speech:
+                self.metrics['speech_frames'] += 1
+            self.metrics['energy_values'].append(energy)
+            self.metrics['zcr_values'].append(zero_crossing_rate)
+            
+            # Guarded: the f-string would otherwise be formatted 50x/s per
+            # channel even with debug logging off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Channel VAD: energy={energy:.2e} (>{self.energy_threshold:.2e}), "
+                            f"zcr={zero_crossing_rate:.3f} ({self.zcr_min}-{self.zcr_max}), speech={is_speech}")
             return is_speech
             
         except Exception as e:
             logger.error(f"VAD error: {e}")
             return False
     
+    def _preroll_push(self, frame: np.ndarray):
+        """Write a frame into the preroll ring buffer"""
+        n = len(frame)
+        size = self._preroll_samples
+        if n >= size:
+            self._preroll[:] = frame[-size:]
+            self._preroll_head = 0
+            self._preroll_fill = size
+            return
+        head = self._preroll_head
+        first = min(n, size - head)
+        self._preroll[head:head + first] = frame[:first]
+        if first < n:
+            self._preroll[:n - first] = frame[first:]
+        self._preroll_head = (head + n) % size
+        self._preroll_fill = min(self._preroll_fill + n, size)
+
+    def _preroll_flush_into_tx(self):
+        """Copy the buffered preroll (oldest first) into the transmission buffer"""
+        fill = self._preroll_fill
+        if fill == 0:
+            return
+        if fill < self._preroll_samples:
+            # Never wrapped: samples live at the start of the buffer
+            self._tx_append(self._preroll[:fill])
+        else:
+            head = self._preroll_head
+            self._tx_append(self._preroll[head:])
+            self._tx_append(self._preroll[:head])
+
+    def _tx_append(self, samples: np.ndarray):
+        """Append samples to the transmission buffer, clamping at capacity"""
+        n = min(len(samples), self._tx_capacity - self._tx_len)
+        if n > 0:
+            self._tx_buf[self._tx_len:self._tx_len + n] = samples[:n]
+            self._tx_len += n
+
     def process_frame(self, frame: np.ndarray) -> Optional[np.ndarray]:
         """Process a single audio frame and return completed transmission if any"""
         try:
             # Run VAD on the frame
             is_speech = self.simple_vad(frame)
+            return self._advance_state(frame, is_speech)
+
+        except Exception as e:
+            logger.error(f"Error processing frame: {e}")
+            return None
+
+    def _advance_state(self, frame: np.ndarray, is_speech: bool) -> Optional[np.ndarray]:
+        """Advance the transmission state machine with a frame and its VAD verdict"""
+        if is_speech:
+            self.speech_frame_count += 1
+            self.silence_frame_count = 0
+            
+            # Check if we should start a new transmission
+            if not self.is_in_transmission and self.speech_frame_count >= self.speech_frames_to_start:
+                self.is_in_transmission = True
+                self._tx_len = 0
+
+                # Collect metrics for auto-tuner (single-writer, see simple_vad)
+                self.metrics['transmissions_started'] += 1
+
+                # Add preroll buffer to transmission
+                self._preroll_flush_into_tx()
+
+                logger.debug("Started new transmission")
+
+            # Add current frame to transmission if we're recording
+            if self.is_in_transmission:
+                self._tx_append(frame)
+        
+        else:  # Not speech
+            self.silence_frame_count += 1
+            self.speech_frame_count = max(0, self.speech_frame_count - 1)  # Decay speech count
             
-            if is_speech:
-                self.speech_frame_count += 1
-                self.silence_frame_count = 0
-                
-                # Check if we should start a new transmission
-                if not self.is_in_transmission and self.speech_frame_count >= self.speech_frames_to_start:
-                    self.is_in_transmission = True
-                    self.current_transmission = []
-                    
-                    # Collect metrics for auto-tuner
-                    with self.metrics_lock:
-                        self.metrics['transmissions_started'] += 1
-                    
-                    # Add preroll buffer to transmission
-                    for preroll_frame in self.preroll_buffer:
-                        self.current_transmission.extend(preroll_frame)
-                    
-                    logger.debug("Started new transmission")
-                
-                # Add current frame to transmission if we're recording
-                if self.is_in_transmission:
-                    self.current_transmission.extend(frame)
-            
-            else:  # Not speech
-                self.silence_frame_count += 1
-                self.speech_frame_count = max(0, self.speech_frame_count - 1)  # Decay speech count
-                
-                # Add frame to transmission if we're still in hang time
-                if self.is_in_transmission:
-                    self.current_transmission.extend(frame)
-                    
-                    # Check if we should end the transmission
-                    if self.silence_frame_count >= self.hang_time_frames:
-                        transmission_audio = np.array(self.current_transmission)
-                        transmission_length_ms = len(transmission_audio) * 1000 / self.target_sample_rate
-                        
-                        # Check transmission length
-                        if self.min_transmission_ms <= transmission_length_ms <= self.max_transmission_ms:
-                            logger.info(f"Completed transmission: {transmission_length_ms:.0f}ms")
-                            
-                            # Collect metrics for auto-tuner
-                            with self.metrics_lock:
-                                self.metrics['transmissions_completed'] += 1
-                                self.metrics['transmission_durations'].append(transmission_length_ms)
-                                # Keep last 100 durations for memory efficiency
-                                if len(self.metrics['transmission_durations']) > 100:
-                                    self.metrics['transmission_durations'].pop(0)
-                            
-                            # Reset state
-                            self.is_in_transmission = False
-                            self.current_transmission = None
-                            self.speech_frame_count = 0
-                            self.silence_frame_count = 0
-                            
-                            return transmission_audio
-                        else:
-                            logger.debug(f"Discarded transmission: {transmission_length_ms:.0f}ms (out of range)")
-                            
-                            # Collect metrics for auto-tuner
-                            with self.metrics_lock:
-                                self.metrics['transmissions_discarded'] += 1
-                                if transmission_length_ms < self.min_transmission_ms:
-                                    self.metrics['false_positives'] += 1
-                        
-                        # Reset state even if transmission was discarded
+            # Add frame to transmission if we're still in hang time
+            if self.is_in_transmission:
+                self._tx_append(frame)
+
+                # Check if we should end the transmission
+                if self.silence_frame_count >= self.hang_time_frames:
+                    # Check transmission length against the precomputed sample
+                    # bounds - ms conversion only happens for logging/metrics
+                    if self._min_tx_samples <= self._tx_len <= self._max_tx_samples:
+                        transmission_length_ms = self._tx_len * 1000 / self.target_sample_rate
+                        logger.info(f"Completed transmission: {transmission_length_ms:.0f}ms")
+                        transmission_audio = self._tx_buf[:self._tx_len].copy()
+
+                        # Collect metrics for auto-tuner
+                        self.metrics['transmissions_completed'] += 1
+                        self.metrics['transmission_durations'].append(transmission_length_ms)
+
+                        # Reset state
                         self.is_in_transmission = False
-                        self.current_transmission = None
+                        self._tx_len = 0
                         self.speech_frame_count = 0
                         self.silence_frame_count = 0
-            
-            # Maintain preroll buffer
-            self.preroll_buffer.append(frame.copy())
-            preroll_frames = int(self.preroll_ms / self.frame_duration_ms)
-            if len(self.preroll_buffer) > preroll_frames:
-                self.preroll_buffer.pop(0)
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error processing frame: {e}")
-            return None
-    
+
+                        return transmission_audio
+                    else:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Discarded transmission: "
+                                         f"{self._tx_len * 1000 / self.target_sample_rate:.0f}ms (out of range)")
+
+                        # Collect metrics for auto-tuner
+                        self.metrics['transmissions_discarded'] += 1
+                        if self._tx_len < self._min_tx_samples:
+                            self.metrics['false_positives'] += 1
+                    
+                    # Reset state even if transmission was discarded
+                    self.is_in_transmission = False
+                    self._tx_len = 0
+                    self.speech_frame_count = 0
+                    self.silence_frame_count = 0
+        
+        # Maintain preroll buffer
+        self._preroll_push(frame)
+
+        return None
+
     def process_mp3_stream(self, mp3_data: bytes) -> List[np.ndarray]:
         """Process MP3 stream data and return list of detected transmissions"""
         try:
@@ -383,28 +605,59 @@ class AudioProcessor:
             if self.enable_agc:
                 audio = self.apply_agc(audio)
             
-            # Process in frames
+            # Score every frame in one vectorized pass: reshape into a
+            # (nframes, frame_size) matrix and compute energy and ZCR for all
+            # frames at once, so only the small state machine runs per frame
+            nframes = len(audio) // self.frame_size
+            if nframes == 0:
+                return []
+            frames = audio[:nframes * self.frame_size].reshape(nframes, self.frame_size)
+            energies = np.einsum('ij,ij->i', frames, frames)
+            signs = np.signbit(frames)
+            zcrs = 2.0 * np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / self.frame_size
+            speech_flags = ((energies > self.energy_threshold)
+                            & (zcrs > self.zcr_min) & (zcrs < self.zcr_max))
+
+            # Batch the per-frame metric samples (see simple_vad for the
+            # single-writer locking rationale)
+            self.metrics['frames_processed'] += nframes
+            self.metrics['speech_frames'] += int(np.count_nonzero(speech_flags))
+            self.metrics['energy_values'].extend(energies.tolist())
+            self.metrics['zcr_values'].extend(zcrs.tolist())
+
             transmissions = []
-            for i in range(0, len(audio) - self.frame_size + 1, self.frame_size):
-                frame = audio[i:i + self.frame_size]
-                transmission = self.process_frame(frame)
+            for i in range(nframes):
+                transmission = self._advance_state(frames[i], bool(speech_flags[i]))
                 if transmission is not None:
                     transmissions.append(transmission)
-            
+
             return transmissions
             
         except Exception as e:
             logger.error(f"Error processing MP3 stream: {e}")
             return []
-    
+
+    def process_mp3_stream_async(self, mp3_data: bytes) -> 'concurrent.futures.Future':
+        """Process an MP3 chunk on the shared DSP pool instead of the caller's thread
+
+        Returns a Future resolving to the same transmission list as
+        process_mp3_stream, so the network reader thread isn't blocked by
+        decode/filter/VAD work. The state machine is per-instance: submit one
+        channel's chunks in order and wait on each Future before submitting
+        the next for that channel.
+        """
+        return self._get_dsp_pool().submit(self.process_mp3_stream, mp3_data)
+
     def save_transmission_flac(self, audio: np.ndarray, filepath: str, metadata: dict = None) -> bool:
         """Save transmission as FLAC with metadata"""
         try:
-            # Ensure audio is in valid range
-            audio = np.clip(audio, -1.0, 1.0)
-            
+            # Quantize to int16 before handing off: FLAC stores 16-bit anyway,
+            # and feeding libsndfile integers halves its input bandwidth.
+            # The clip bounds also keep out-of-range floats from wrapping.
+            audio_i16 = np.clip(audio * 32767.0, -32768, 32767).astype(np.int16)
+
             # Save as FLAC
-            sf.write(filepath, audio, self.target_sample_rate, format='FLAC')
+            sf.write(filepath, audio_i16, self.target_sample_rate, format='FLAC', subtype='PCM_16')
             
             # Add metadata if provided (this would require additional metadata handling)
             if metadata:
@@ -419,8 +672,9 @@ class AudioProcessor:
     
     def reset_state(self):
         """Reset processor state (useful for new streams)"""
-        self.preroll_buffer = []
-        self.current_transmission = None
+        self._preroll_head = 0
+        self._preroll_fill = 0
+        self._tx_len = 0
         self.speech_frame_count = 0
         self.silence_frame_count = 0
         self.is_in_transmission = False
@@ -429,38 +683,29 @@ class AudioProcessor:
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics for auto-tuner analysis"""
         with self.metrics_lock:
+            # Reuse the last snapshot if no frames arrived since it was built
+            # (frequent polling between frames would otherwise redo all the
+            # percentile work); only the clock fields are refreshed
+            cached_frames, cached_result = self._metrics_cache
+            if cached_result is not None and cached_frames == self.metrics['frames_processed']:
+                cached_result['timestamp'] = time.time()
+                cached_result['uptime_seconds'] = time.time() - self.metrics['last_reset']
+                return cached_result
+
             # Calculate derived metrics
             uptime = time.time() - self.metrics['last_reset']
             speech_ratio = (self.metrics['speech_frames'] / max(1, self.metrics['frames_processed']))
-            
+
             # Calculate energy and ZCR statistics
             energy_stats = {}
             zcr_stats = {}
-            
+
             if self.metrics['energy_values']:
-                energy_vals = np.array(self.metrics['energy_values'])
-                energy_stats = {
-                    'mean': float(np.mean(energy_vals)),
-                    'std': float(np.std(energy_vals)),
-                    'min': float(np.min(energy_vals)),
-                    'max': float(np.max(energy_vals)),
-                    'percentile_25': float(np.percentile(energy_vals, 25)),
-                    'percentile_75': float(np.percentile(energy_vals, 75)),
-                    'percentile_95': float(np.percentile(energy_vals, 95))
-                }
-            
+                energy_stats = _distribution_stats(self.metrics['energy_values'])
+
             if self.metrics['zcr_values']:
-                zcr_vals = np.array(self.metrics['zcr_values'])
-                zcr_stats = {
-                    'mean': float(np.mean(zcr_vals)),
-                    'std': float(np.std(zcr_vals)),
-                    'min': float(np.min(zcr_vals)),
-                    'max': float(np.max(zcr_vals)),
-                    'percentile_25': float(np.percentile(zcr_vals, 25)),
-                    'percentile_75': float(np.percentile(zcr_vals, 75)),
-                    'percentile_95': float(np.percentile(zcr_vals, 95))
-                }
-            
+                zcr_stats = _distribution_stats(self.metrics['zcr_values'])
+
             # Calculate transmission statistics
             avg_duration = 0
             if self.metrics['transmission_durations']:
@@ -474,7 +719,7 @@ class AudioProcessor:
             if self.metrics['transmissions_started'] > 0:
                 completion_rate = self.metrics['transmissions_completed'] / self.metrics['transmissions_started']
             
-            return {
+            result = {
                 'timestamp': time.time(),
                 'uptime_seconds': uptime,
                 'frames_processed': self.metrics['frames_processed'],
@@ -488,37 +733,43 @@ class AudioProcessor:
                 'completion_rate': completion_rate,
                 'avg_transmission_duration': avg_duration,
                 'current_thresholds': {
-                    'energy_threshold': self.metrics['energy_threshold'],
-                    'zcr_min': self.metrics['zcr_min'],
-                    'zcr_max': self.metrics['zcr_max'],
+                    'energy_threshold': self.energy_threshold,
+                    'zcr_min': self.zcr_min,
+                    'zcr_max': self.zcr_max,
                     'speech_frames_to_start': self.speech_frames_to_start,
                     'hang_time_ms': self.hang_time_ms
                 },
                 'energy_stats': energy_stats,
                 'zcr_stats': zcr_stats
             }
-    
+            self._metrics_cache = (self.metrics['frames_processed'], result)
+            return result
+
     def reset_metrics(self):
         """Reset metrics collection (called after auto-tuner analysis)"""
         with self.metrics_lock:
             self.metrics = {
                 'frames_processed': 0,
                 'speech_frames': 0,
-                'energy_values': [],
-                'zcr_values': [],
+                'energy_values': deque(maxlen=1000),
+                'zcr_values': deque(maxlen=1000),
                 'transmissions_started': 0,
                 'transmissions_completed': 0,
                 'transmissions_discarded': 0,
-                'transmission_durations': [],
+                'transmission_durations': deque(maxlen=100),
                 'false_positives': 0,
                 'last_reset': time.time(),
                 'energy_threshold': self.energy_threshold,
                 'zcr_min': self.zcr_min,
                 'zcr_max': self.zcr_max
             }
-    
+            self._metrics_cache = (-1, None)
+
     def update_vad_parameters(self, new_params: Dict[str, float]):
         """Update VAD parameters from auto-tuner recommendations"""
+        # Thresholds feed the cached get_metrics snapshot - drop it
+        self._metrics_cache = (-1, None)
+
         if 'energy_threshold' in new_params:
             self.energy_threshold = new_params['energy_threshold']
             logger.info(f"Updated energy_threshold to {self.energy_threshold:.2e}")
@@ -539,3 +790,21 @@ class AudioProcessor:
             self.hang_time_ms = new_params['hang_time_ms']
             self.hang_time_frames = int(self.hang_time_ms / self.frame_duration_ms)
             logger.info(f"Updated hang_time_ms to {self.hang_time_ms}")
+
+        if 'min_transmission_ms' in new_params:
+            self.min_transmission_ms = new_params['min_transmission_ms']
+            self._min_tx_samples = int(self.min_transmission_ms * self.target_sample_rate / 1000)
+            logger.info(f"Updated min_transmission_ms to {self.min_transmission_ms}")
+
+        if 'max_transmission_ms' in new_params:
+            self.max_transmission_ms = new_params['max_transmission_ms']
+            self._max_tx_samples = int(self.max_transmission_ms * self.target_sample_rate / 1000)
+            # Grow the preallocated transmission buffer if the new maximum no
+            # longer fits (shrinking is not worth the churn)
+            needed = self._max_tx_samples + self._preroll_samples + self.frame_size
+            if needed > self._tx_capacity:
+                new_buf = np.empty(needed, dtype=np.float32)
+                new_buf[:self._tx_len] = self._tx_buf[:self._tx_len]
+                self._tx_buf = new_buf
+                self._tx_capacity = needed
+            logger.info(f"Updated max_transmission_ms to {self.max_transmission_ms}")
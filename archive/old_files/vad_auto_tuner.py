@@ -7,14 +7,103 @@ Analyzes channel performance and automatically adjusts VAD parameters for optima
 import json
 import numpy as np
 import logging
+import os
 import sqlite3
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from collections import defaultdict
-import statistics
+from scipy.fft import rfft, rfftfreq
+from scipy.signal import decimate
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain NumPy
+    njit = None
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional - fall back to stdlib json
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Frequency vectors keyed by (chunk length, sample rate): chunks arrive at a
+# fixed size per stream, so the vector is computed once instead of per call
+_FREQ_CACHE: Dict[Tuple[int, int], np.ndarray] = {}
+
+
+def _freqs(n: int, sample_rate: int) -> np.ndarray:
+    """Cached rfftfreq vector for a chunk length and sample rate"""
+    key = (n, sample_rate)
+    freqs = _FREQ_CACHE.get(key)
+    if freqs is None:
+        freqs = _FREQ_CACHE[key] = rfftfreq(n, 1.0 / sample_rate)
+    return freqs
+
+
+# Speech heuristic bounds: energy (mean-square), ZCR (crossing fraction) and
+# spectral centroid (Hz) ranges typical of speech
+_SPEECH_ENERGY_BOUNDS = (1e-06, 1e-03)
+_SPEECH_ZCR_BOUNDS = (0.05, 0.3)
+_SPEECH_CENTROID_BOUNDS = (300.0, 3000.0)
+
+
+def speech_prob_vec(energy, zcr, spectral_centroid):
+    """Speech-probability score, elementwise over arrays or scalars
+
+    Branchless np.where form of the collector's heuristic, so stored metric
+    columns can be re-scored in one NumPy pass (e.g. after the bounds
+    change) instead of a Python loop per row.
+    """
+    energy_score = np.where((energy > _SPEECH_ENERGY_BOUNDS[0])
+                            & (energy < _SPEECH_ENERGY_BOUNDS[1]), 1.0, 0.5)
+    zcr_score = np.where((zcr > _SPEECH_ZCR_BOUNDS[0])
+                         & (zcr < _SPEECH_ZCR_BOUNDS[1]), 1.0, 0.3)
+    spectral_score = np.where((spectral_centroid > _SPEECH_CENTROID_BOUNDS[0])
+                              & (spectral_centroid < _SPEECH_CENTROID_BOUNDS[1]), 1.0, 0.4)
+    return (energy_score + zcr_score + spectral_score) / 3.0
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _chunk_features_kernel(x, magnitude, freqs):
+        """Fused time-domain feature kernel: one native pass per chunk
+
+        Returns (energy, noise_floor, zcr, centroid). The FFT stays in
+        Python (scipy) - only its magnitude comes in. The noise floor is the
+        nearest-rank 10th percentile via np.partition, O(n) instead of a
+        sort.
+        """
+        n = x.shape[0]
+        sq = x * x
+        energy = sq.mean()
+        k = max(1, n // 10) - 1
+        noise_floor = np.partition(sq, k)[k]
+        crossings = 0
+        prev = x[0] < 0
+        for i in range(1, n):
+            neg = x[i] < 0
+            if neg != prev:
+                crossings += 1
+            prev = neg
+        zcr = crossings / n
+        total = magnitude.sum()
+        centroid = 0.0 if total == 0 else (freqs * magnitude).sum() / total
+        return energy, noise_floor, zcr, centroid
+else:
+    _chunk_features_kernel = None
 
 @dataclass
 class ChannelMetrics:
@@ -40,16 +129,57 @@ class AutoAdjustConfig:
 class VadMetricsCollector:
     """Collects and stores audio metrics for analysis"""
     
-    def __init__(self, db_path: str = "vad_metrics.db"):
+    def __init__(self, db_path: str = "vad_metrics.db",
+                 chunk_size: Optional[int] = None,
+                 sample_rate: Optional[int] = None):
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+        # A recorder feeds fixed-size chunks at a fixed rate for its whole
+        # lifetime. When both are known up front, everything collect_metrics
+        # would re-derive per call (decimation factor, frequency vector,
+        # noise-floor partition rank) is bound once here and collect_fast
+        # skips the per-call prelude entirely.
+        self._spec = None
+        if chunk_size and sample_rate:
+            factor = sample_rate // 8000 if sample_rate > 8000 else 1
+            feat_n = int(np.ceil(chunk_size / factor)) if factor > 1 else chunk_size
+            feat_rate = sample_rate // factor if factor > 1 else sample_rate
+            self._spec = {
+                'chunk_size': chunk_size,
+                'sample_rate': sample_rate,
+                'factor': factor,
+                'freqs': rfftfreq(feat_n, 1.0 / feat_rate),
+                'partition_k': max(1, feat_n // 10) - 1
+            }
+        # Pending metric rows, flushed in one transaction once full. Per-row
+        # connect/INSERT/commit was dominated by fsync and statement prep.
+        self._buffer: List[tuple] = []
+        self._buffer_limit = 128
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                     check_same_thread=False)
+        # Collectors can be shared across recorder threads; serialize buffer
+        # mutation and flushes
+        self._write_lock = threading.Lock()
         self._init_database()
-    
+        if _chunk_features_kernel is not None:
+            # Warm-up call so numba compiles off the hot path
+            warm = np.zeros(16, dtype=np.float32)
+            _chunk_features_kernel(warm, np.abs(rfft(warm)), _freqs(16, 16000))
+
     def _init_database(self):
         """Initialize SQLite database for metrics storage"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
-        
+
+        # WAL avoids writer-blocks-reader stalls and makes commits cheaper;
+        # NORMAL sync is safe with WAL for metrics data we can afford to lose
+        # a batch of on power failure
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")     # 64MB page cache
+        cursor.execute("PRAGMA mmap_size=268435456")   # mmap reads up to 256MB
+
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS channel_metrics (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -67,24 +197,61 @@ class VadMetricsCollector:
         """)
         
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_channel_timestamp 
+            CREATE INDEX IF NOT EXISTS idx_channel_timestamp
             ON channel_metrics(channel_name, timestamp)
         """)
-        
-        conn.commit()
-        conn.close()
+
+        # Covering index for the analysis queries: includes every column the
+        # aggregates and percentile fetches read, so SQLite answers them from
+        # the index B-tree without a rowid lookup per matched row
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_channel_ts_cover
+            ON channel_metrics(channel_name, timestamp, was_recorded,
+                               energy_level, zcr, speech_probability,
+                               recording_duration_ms)
+        """)
     
     def collect_metrics(self, channel_name: str, audio_chunk: np.ndarray, 
                        sample_rate: int, was_recorded: bool, 
                        recording_duration_ms: int = 0):
         """Collect metrics from an audio chunk"""
-        
+
+        # Speech content lives below 4kHz, so energy/ZCR/centroid are just as
+        # informative at 8kHz - decimating first shrinks every downstream op
+        # (square, partition, FFT) by the same factor. Only the analysis copy
+        # is downsampled; callers keep their full-rate audio.
+        if sample_rate > 8000:
+            factor = sample_rate // 8000
+            if factor > 1:
+                audio_chunk = decimate(audio_chunk, factor, ftype='iir',
+                                       zero_phase=False).astype(audio_chunk.dtype, copy=False)
+                sample_rate //= factor
+
         # Calculate audio characteristics
-        energy_level = np.mean(audio_chunk ** 2)
-        zcr = self._calculate_zcr(audio_chunk)
-        spectral_centroid = self._calculate_spectral_centroid(audio_chunk, sample_rate)
-        noise_floor = self._estimate_noise_floor(audio_chunk)
-        speech_prob = self._estimate_speech_probability(audio_chunk, sample_rate)
+        # One fused feature pass: energy and noise floor share a single
+        # squared array, ZCR is one sign-bit scan, the centroid one FFT, and
+        # the probability score reuses all of the above - nothing touches the
+        # chunk twice. With numba available the time-domain work collapses
+        # into one compiled kernel call, which matters on small chunks where
+        # NumPy dispatch overhead dominates.
+        if _chunk_features_kernel is not None:
+            magnitude = np.abs(rfft(audio_chunk, workers=-1))
+            energy_level, noise_floor, zcr, spectral_centroid = (
+                _chunk_features_kernel(np.ascontiguousarray(audio_chunk), magnitude,
+                                       _freqs(len(audio_chunk), sample_rate)))
+            energy_level = float(energy_level)
+            noise_floor = float(noise_floor)
+            zcr = float(zcr)
+            spectral_centroid = float(spectral_centroid)
+        else:
+            squared = audio_chunk ** 2
+            energy_level = float(np.mean(squared))
+            k = max(1, squared.size // 10) - 1
+            noise_floor = float(np.partition(squared, k)[k])
+            zcr = self._calculate_zcr(audio_chunk)
+            spectral_centroid = self._calculate_spectral_centroid(audio_chunk, sample_rate)
+        speech_prob = self._estimate_speech_probability(
+            energy_level, zcr, spectral_centroid)
         
         metrics = ChannelMetrics(
             timestamp=time.time(),
@@ -100,77 +267,158 @@ class VadMetricsCollector:
         self._store_metrics(channel_name, metrics)
         return metrics
     
+    def collect_fast(self, channel_name: str, audio_chunk: np.ndarray,
+                     was_recorded: bool, recording_duration_ms: int = 0):
+        """Collect metrics assuming the configured (chunk_size, sample_rate)
+
+        Uses the frequency vector, decimation factor and partition rank
+        bound at construction; chunks with a different length fall back to
+        the generic collect_metrics.
+        """
+        spec = self._spec
+        if spec is None:
+            raise ValueError("collect_fast requires chunk_size and sample_rate "
+                             "to be set at construction")
+        if audio_chunk.size != spec['chunk_size']:
+            return self.collect_metrics(channel_name, audio_chunk,
+                                        spec['sample_rate'], was_recorded,
+                                        recording_duration_ms)
+
+        if spec['factor'] > 1:
+            audio_chunk = decimate(audio_chunk, spec['factor'], ftype='iir',
+                                   zero_phase=False).astype(audio_chunk.dtype, copy=False)
+
+        freqs = spec['freqs']
+        magnitude = np.abs(rfft(audio_chunk, workers=-1))
+        if _chunk_features_kernel is not None:
+            energy_level, noise_floor, zcr, spectral_centroid = (
+                _chunk_features_kernel(np.ascontiguousarray(audio_chunk),
+                                       magnitude, freqs))
+            energy_level = float(energy_level)
+            noise_floor = float(noise_floor)
+            zcr = float(zcr)
+            spectral_centroid = float(spectral_centroid)
+        else:
+            squared = audio_chunk ** 2
+            energy_level = float(np.mean(squared))
+            k = spec['partition_k']
+            noise_floor = float(np.partition(squared, k)[k])
+            zcr = self._calculate_zcr(audio_chunk)
+            total = magnitude.sum()
+            spectral_centroid = (0.0 if total == 0
+                                 else float((freqs * magnitude).sum() / total))
+
+        metrics = ChannelMetrics(
+            timestamp=time.time(),
+            energy_level=energy_level,
+            zcr=zcr,
+            spectral_centroid=spectral_centroid,
+            was_recorded=was_recorded,
+            recording_duration_ms=recording_duration_ms,
+            noise_floor_estimate=noise_floor,
+            speech_probability=self._estimate_speech_probability(
+                energy_level, zcr, spectral_centroid)
+        )
+
+        self._store_metrics(channel_name, metrics)
+        return metrics
+
     def _calculate_zcr(self, audio_chunk: np.ndarray) -> float:
-        """Calculate Zero Crossing Rate"""
-        signs = np.sign(audio_chunk)
-        sign_changes = np.diff(signs)
-        zero_crossings = np.sum(np.abs(sign_changes)) / 2
-        return zero_crossings / len(audio_chunk)
+        """Calculate Zero Crossing Rate
+
+        Sign-bit comparison reads the input once and produces a single bool
+        array, instead of the three float temporaries of sign/diff/abs.
+        """
+        signs = np.signbit(audio_chunk)
+        return np.count_nonzero(signs[1:] ^ signs[:-1]) / audio_chunk.size
     
     def _calculate_spectral_centroid(self, audio_chunk: np.ndarray, sample_rate: int) -> float:
-        """Calculate spectral centroid (brightness measure)"""
-        fft = np.fft.fft(audio_chunk)
-        magnitude = np.abs(fft)
-        freqs = np.fft.fftfreq(len(audio_chunk), 1/sample_rate)
-        
-        # Only use positive frequencies
-        half_len = len(freqs) // 2
-        magnitude = magnitude[:half_len]
-        freqs = freqs[:half_len]
-        
-        if np.sum(magnitude) == 0:
+        """Calculate spectral centroid (brightness measure)
+
+        rfft exploits conjugate symmetry of real input, returning only the
+        non-redundant half-spectrum - half the work and memory of the full
+        complex fft whose negative frequencies were thrown away anyway.
+        scipy's pocketfft backend preserves float32 input and can thread
+        large transforms; the frequency vector is cached per chunk size.
+        """
+        magnitude = np.abs(rfft(audio_chunk, workers=-1))
+        freqs = _freqs(len(audio_chunk), sample_rate)
+
+        total = magnitude.sum()
+        if total == 0:
             return 0.0
-        
-        centroid = np.sum(freqs * magnitude) / np.sum(magnitude)
-        return centroid
+
+        return float((freqs * magnitude).sum() / total)
     
     def _estimate_noise_floor(self, audio_chunk: np.ndarray) -> float:
-        """Estimate noise floor using lower percentiles"""
+        """Estimate noise floor using lower percentiles
+
+        Nearest-rank 10th percentile via np.partition: O(n) selection
+        instead of the full sort np.percentile runs for one quantile.
+        """
         energy_levels = audio_chunk ** 2
-        return np.percentile(energy_levels, 10)  # 10th percentile as noise floor
+        k = max(1, energy_levels.size // 10) - 1
+        return float(np.partition(energy_levels, k)[k])
     
-    def _estimate_speech_probability(self, audio_chunk: np.ndarray, sample_rate: int) -> float:
-        """Estimate probability that audio contains speech"""
-        # Simple heuristic based on energy distribution and spectral characteristics
-        energy = np.mean(audio_chunk ** 2)
-        zcr = self._calculate_zcr(audio_chunk)
-        spectral_centroid = self._calculate_spectral_centroid(audio_chunk, sample_rate)
-        
-        # Speech typically has:
-        # - Moderate energy levels
-        # - ZCR in range 0.05-0.3
-        # - Spectral centroid in speech range (300-3000 Hz)
-        
-        energy_score = 1.0 if 1e-06 < energy < 1e-03 else 0.5
-        zcr_score = 1.0 if 0.05 < zcr < 0.3 else 0.3
-        spectral_score = 1.0 if 300 < spectral_centroid < 3000 else 0.4
-        
-        return (energy_score + zcr_score + spectral_score) / 3.0
+    def _estimate_speech_probability(self, energy: float, zcr: float,
+                                     spectral_centroid: float) -> float:
+        """Estimate probability that audio contains speech
+
+        Takes the features already computed in collect_metrics rather than
+        re-deriving them from the raw chunk. Scalar wrapper over
+        speech_prob_vec, which holds the heuristic and its bounds.
+        """
+        return float(speech_prob_vec(energy, zcr, spectral_centroid))
     
     def _store_metrics(self, channel_name: str, metrics: ChannelMetrics):
-        """Store metrics in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO channel_metrics 
-            (channel_name, timestamp, energy_level, zcr, spectral_centroid, 
-             was_recorded, recording_duration_ms, noise_floor_estimate, speech_probability)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            channel_name, metrics.timestamp, metrics.energy_level, metrics.zcr,
-            metrics.spectral_centroid, metrics.was_recorded, metrics.recording_duration_ms,
-            metrics.noise_floor_estimate, metrics.speech_probability
-        ))
-        
-        conn.commit()
-        conn.close()
-    
+        """Buffer metrics for batched insertion"""
+        with self._write_lock:
+            self._buffer.append((
+                channel_name, metrics.timestamp, metrics.energy_level, metrics.zcr,
+                metrics.spectral_centroid, metrics.was_recorded, metrics.recording_duration_ms,
+                metrics.noise_floor_estimate, metrics.speech_probability
+            ))
+            should_flush = len(self._buffer) >= self._buffer_limit
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered metric rows in a single transaction"""
+        with self._write_lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        try:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("""
+                INSERT INTO channel_metrics
+                (channel_name, timestamp, energy_level, zcr, spectral_centroid,
+                 was_recorded, recording_duration_ms, noise_floor_estimate, speech_probability)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, self._buffer)
+            self._conn.execute("COMMIT")
+            self._buffer.clear()
+        except Exception as e:
+            self.logger.error(f"Failed to flush metrics buffer: {e}")
+            try:
+                self._conn.execute("ROLLBACK")
+            except sqlite3.OperationalError:
+                pass
+
+    def close(self):
+        """Flush pending metrics and close the database connection"""
+        self.flush()
+        self._conn.close()
+
     def get_channel_metrics(self, channel_name: str, hours_back: int = 24) -> List[ChannelMetrics]:
         """Retrieve metrics for a channel within specified time window"""
-        conn = sqlite3.connect(self.db_path)
+        # Make buffered rows visible to the query
+        self.flush()
+        conn = self._conn
         cursor = conn.cursor()
-        
+
         cutoff_time = time.time() - (hours_back * 3600)
         
         cursor.execute("""
@@ -182,10 +430,83 @@ class VadMetricsCollector:
         """, (channel_name, cutoff_time))
         
         rows = cursor.fetchall()
-        conn.close()
-        
+
         return [ChannelMetrics(*row) for row in rows]
 
+    ALL_METRIC_COLUMNS = ('timestamp', 'energy_level', 'zcr', 'spectral_centroid',
+                          'was_recorded', 'recording_duration_ms',
+                          'noise_floor_estimate', 'speech_probability')
+
+    def get_channel_metrics_columns(self, channel_name: str, hours_back: int = 24,
+                                    columns: Tuple[str, ...] = ALL_METRIC_COLUMNS
+                                    ) -> Dict[str, np.ndarray]:
+        """Retrieve metrics as column arrays for vectorized analysis
+
+        Structure-of-arrays counterpart to get_channel_metrics: one fetch,
+        one array per column, so statistics become whole-array NumPy calls
+        instead of list comprehensions over dataclass instances. Pass a
+        subset of column names to avoid serializing fields the caller will
+        never look at.
+        """
+        self.flush()
+        cursor = self._conn.cursor()
+
+        cutoff_time = time.time() - (hours_back * 3600)
+
+        cursor.execute(f"""
+            SELECT {', '.join(columns)}
+            FROM channel_metrics
+            WHERE channel_name = ? AND timestamp > ?
+            ORDER BY timestamp DESC
+        """, (channel_name, cutoff_time))
+
+        rows = cursor.fetchall()
+        if not rows:
+            result = {name: np.empty(0) for name in columns}
+        else:
+            arr = np.asarray(rows, dtype=object)
+            result = {name: arr[:, i].astype(np.float64) for i, name in enumerate(columns)}
+        if 'was_recorded' in result:
+            result['was_recorded'] = result['was_recorded'].astype(bool)
+        return result
+
+    def get_channel_aggregates(self, channel_name: str, hours_back: int = 24) -> Dict:
+        """Compute window counts and rates inside SQLite in one query
+
+        Counts, sums and averages don't need every row serialized across the
+        Python boundary - one aggregate SELECT returns them all. Percentile
+        statistics still require the raw columns.
+        """
+        self.flush()
+        cursor = self._conn.cursor()
+
+        cutoff_time = time.time() - (hours_back * 3600)
+
+        cursor.execute("""
+            SELECT COUNT(*),
+                   SUM(was_recorded),
+                   SUM(was_recorded AND speech_probability < 0.3),
+                   SUM((NOT was_recorded) AND speech_probability > 0.7),
+                   SUM(was_recorded AND recording_duration_ms > 0),
+                   SUM(was_recorded AND recording_duration_ms > 0
+                       AND recording_duration_ms < 1000),
+                   AVG(CASE WHEN was_recorded AND recording_duration_ms > 0
+                            THEN recording_duration_ms END)
+            FROM channel_metrics
+            WHERE channel_name = ? AND timestamp > ?
+        """, (channel_name, cutoff_time))
+
+        row = cursor.fetchone()
+        return {
+            'total_samples': row[0] or 0,
+            'recorded_samples': row[1] or 0,
+            'false_positives': row[2] or 0,
+            'potential_missed': row[3] or 0,
+            'duration_samples': row[4] or 0,
+            'short_recordings': row[5] or 0,
+            'avg_recording_duration': row[6] or 0
+        }
+
 class VadAutoTuner:
     """Analyzes channel performance and automatically adjusts VAD parameters"""
     
@@ -194,93 +515,132 @@ class VadAutoTuner:
         self.metrics_collector = VadMetricsCollector()
         self.logger = logging.getLogger(__name__)
         self.adjustment_history = defaultdict(list)
+        # Parsed config cached against the file's mtime: the adjustment cycle
+        # reloads once per channel otherwise
+        self._cfg_cache = None
+        self._cfg_mtime = 0
     
     def load_channel_config(self) -> Dict:
-        """Load channel configuration"""
-        with open(self.config_path, 'r') as f:
-            return json.load(f)
-    
+        """Load channel configuration (cached until the file changes)"""
+        mtime = os.path.getmtime(self.config_path)
+        if self._cfg_cache is not None and mtime == self._cfg_mtime:
+            return self._cfg_cache
+        with open(self.config_path, 'rb') as f:
+            config = _json_loads(f.read())
+        self._cfg_cache = config
+        self._cfg_mtime = mtime
+        return config
+
     def save_channel_config(self, config: Dict):
         """Save updated channel configuration"""
-        with open(self.config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        with open(self.config_path, 'wb') as f:
+            f.write(_json_dumps(config))
+        self._cfg_cache = config
+        self._cfg_mtime = os.path.getmtime(self.config_path)
     
     def analyze_channel_performance(self, channel_name: str, 
                                   auto_adjust_config: AutoAdjustConfig) -> Dict:
         """Analyze channel performance and calculate optimal parameters"""
         
-        metrics = self.metrics_collector.get_channel_metrics(
+        # Counts and rates come back as one aggregate row - no row transfer
+        # at all when the sample count is too low to proceed
+        aggregates = self.metrics_collector.get_channel_aggregates(
             channel_name, auto_adjust_config.analysis_window_hours
         )
-        
-        if len(metrics) < auto_adjust_config.min_samples_required:
+        sample_count = aggregates['total_samples']
+
+        if sample_count < auto_adjust_config.min_samples_required:
             self.logger.warning(f"Insufficient data for {channel_name}: "
-                              f"{len(metrics)} samples (need {auto_adjust_config.min_samples_required})")
+                              f"{sample_count} samples (need {auto_adjust_config.min_samples_required})")
             return {}
-        
-        analysis = self._perform_statistical_analysis(metrics, auto_adjust_config)
+
+        # Percentile work still needs raw values, but only three of the
+        # eight columns
+        columns = self.metrics_collector.get_channel_metrics_columns(
+            channel_name, auto_adjust_config.analysis_window_hours,
+            columns=('energy_level', 'zcr', 'was_recorded')
+        )
+
+        analysis = self._perform_statistical_analysis(aggregates, columns, auto_adjust_config)
         recommendations = self._calculate_parameter_recommendations(analysis, auto_adjust_config)
-        
+
         return {
             'analysis': analysis,
             'recommendations': recommendations,
-            'sample_count': len(metrics)
+            'sample_count': int(sample_count)
         }
-    
-    def _perform_statistical_analysis(self, metrics: List[ChannelMetrics], 
+
+    def _perform_statistical_analysis(self, aggregates: Dict,
+                                    columns: Dict[str, np.ndarray],
                                     config: AutoAdjustConfig) -> Dict:
-        """Perform statistical analysis on collected metrics"""
-        
-        # Separate recorded vs non-recorded samples
-        recorded_samples = [m for m in metrics if m.was_recorded]
-        not_recorded_samples = [m for m in metrics if not m.was_recorded]
-        
-        # Calculate statistics for energy levels
-        all_energy = [m.energy_level for m in metrics]
-        recorded_energy = [m.energy_level for m in recorded_samples]
-        not_recorded_energy = [m.energy_level for m in not_recorded_samples]
-        
+        """Perform statistical analysis on collected metrics
+
+        Counts, rates and averages arrive pre-computed from SQLite
+        (get_channel_aggregates); only the percentile statistics are
+        computed here, on the energy/zcr/was_recorded columns.
+        """
+        total = aggregates['total_samples']
+        recorded_count = aggregates['recorded_samples']
+        not_recorded_count = total - recorded_count
+
+        was_recorded = columns['was_recorded']
+        energy = columns['energy_level']
+
         # Calculate noise floor (10th percentile of non-recorded samples)
-        noise_floor = np.percentile(not_recorded_energy, 10) if not_recorded_energy else 0
-        
+        noise_floor = (float(np.percentile(energy[~was_recorded], 10))
+                       if not_recorded_count else 0)
+
         # Calculate speech energy threshold (median of recorded samples)
-        speech_threshold = np.median(recorded_energy) if recorded_energy else 0
-        
-        # Analyze false positives (low speech probability but recorded)
-        false_positives = [m for m in recorded_samples if m.speech_probability < 0.3]
-        false_positive_rate = len(false_positives) / len(recorded_samples) if recorded_samples else 0
-        
-        # Analyze potential missed recordings (high speech probability but not recorded)
-        potential_missed = [m for m in not_recorded_samples if m.speech_probability > 0.7]
-        potential_missed_rate = len(potential_missed) / len(not_recorded_samples) if not_recorded_samples else 0
-        
-        # Calculate ZCR statistics
-        recorded_zcr = [m.zcr for m in recorded_samples]
-        zcr_range = (np.percentile(recorded_zcr, 5), np.percentile(recorded_zcr, 95)) if recorded_zcr else (0.05, 0.35)
-        
-        # Calculate recording duration statistics
-        durations = [m.recording_duration_ms for m in recorded_samples if m.recording_duration_ms > 0]
-        short_recordings = len([d for d in durations if d < 1000])  # < 1 second
-        short_recording_rate = short_recordings / len(durations) if durations else 0
-        
+        speech_threshold = (float(np.median(energy[was_recorded]))
+                            if recorded_count else 0)
+
+        false_positive_rate = (aggregates['false_positives'] / recorded_count
+                               if recorded_count else 0)
+        potential_missed_rate = (aggregates['potential_missed'] / not_recorded_count
+                                 if not_recorded_count else 0)
+
+        # Calculate ZCR statistics - both bounds from one percentile call
+        if recorded_count:
+            zcr_lo, zcr_hi = np.percentile(columns['zcr'][was_recorded], [5, 95])
+            zcr_range = (float(zcr_lo), float(zcr_hi))
+        else:
+            zcr_range = (0.05, 0.35)
+
+        short_recording_rate = (aggregates['short_recordings'] / aggregates['duration_samples']
+                                if aggregates['duration_samples'] else 0)
+
         return {
-            'total_samples': len(metrics),
-            'recorded_samples': len(recorded_samples),
-            'recording_rate': len(recorded_samples) / len(metrics),
+            'total_samples': total,
+            'recorded_samples': recorded_count,
+            'recording_rate': recorded_count / total,
             'noise_floor': noise_floor,
             'speech_threshold': speech_threshold,
             'false_positive_rate': false_positive_rate,
             'potential_missed_rate': potential_missed_rate,
             'zcr_range': zcr_range,
-            'avg_recording_duration': statistics.mean(durations) if durations else 0,
+            'avg_recording_duration': aggregates['avg_recording_duration'],
             'short_recording_rate': short_recording_rate,
-            'energy_stats': {
-                'min': min(all_energy),
-                'max': max(all_energy),
-                'median': statistics.median(all_energy),
-                'p10': np.percentile(all_energy, 10),
-                'p90': np.percentile(all_energy, 90)
-            }
+            'energy_stats': self._energy_stats(energy)
+        }
+
+    @staticmethod
+    def _energy_stats(all_energy: List[float]) -> Dict:
+        """Min/max/median/p10/p90 with one O(n) partition
+
+        A single np.partition places all three percentile ranks at once
+        instead of the two sorts np.percentile would run; nearest-rank
+        values are fine for tuning decisions.
+        """
+        energy_arr = np.asarray(all_energy)
+        n = energy_arr.size
+        ranks = [int(0.10 * (n - 1)), (n - 1) // 2, int(0.90 * (n - 1))]
+        part = np.partition(energy_arr, ranks)
+        return {
+            'min': float(energy_arr.min()),
+            'max': float(energy_arr.max()),
+            'median': float(part[ranks[1]]),
+            'p10': float(part[ranks[0]]),
+            'p90': float(part[ranks[2]])
         }
     
     def _calculate_parameter_recommendations(self, analysis: Dict, 
@@ -432,6 +792,9 @@ class VadAutoTuner:
                 except Exception as e:
                     self.logger.error(f"Error adjusting {channel_name}: {e}")
         
+        # Persist any metrics still sitting in the collector's buffer
+        self.metrics_collector.flush()
+
         self.logger.info(f"Auto-adjustment cycle complete. Adjusted channels: {adjusted_channels}")
         return adjusted_channels
 
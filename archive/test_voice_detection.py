@@ -11,7 +11,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from audio_recorder import AudioRecorder
 from pydub import AudioSegment
-from pydub.generators import Sine, WhiteNoise
+from pydub.generators import WhiteNoise
 import numpy as np
 
 def create_test_audio():
@@ -24,24 +24,25 @@ def create_test_audio():
     noise = WhiteNoise().to_audio_segment(duration=1000) - 20  # Quiet noise
     
     # Create a synthetic voice-like signal (multiple tones with speech-like characteristics)
-    # Human speech typically has fundamental frequencies between 80-300 Hz
-    voice_segment = AudioSegment.silent(duration=2000)
-    
-    # Add multiple harmonics to simulate voice
+    # Human speech typically has fundamental frequencies between 80-300 Hz.
+    # Synthesize all harmonics into one float32 buffer - the time base and
+    # 4 Hz speech-rate modulation are the same for every harmonic, so they
+    # are computed once, and a single int16 conversion replaces the per-tone
+    # _spawn/overlay round trips.
+    sample_rate = 44100
+    n = int(2.0 * sample_rate)
+    t = np.linspace(0, 2, n, dtype=np.float32)
+    modulation = (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)).astype(np.float32)
+
+    buf = np.zeros(n, dtype=np.float32)
     for freq in [150, 300, 450, 600]:  # Fundamental + harmonics
-        tone = Sine(freq).to_audio_segment(duration=2000)
-        # Vary amplitude to simulate speech patterns
-        tone = tone - 15  # Reduce volume
-        # Add some amplitude modulation to simulate speech
-        samples = np.array(tone.get_array_of_samples(), dtype=np.float32)
-        # Simple amplitude modulation at 4 Hz (speech rate)
-        t = np.linspace(0, 2, len(samples))
-        modulation = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
-        modulated_samples = samples * modulation
-        
-        # Convert back to AudioSegment
-        modulated_tone = tone._spawn(modulated_samples.astype(np.int16).tobytes())
-        voice_segment = voice_segment.overlay(modulated_tone)
+        buf += np.sin(2 * np.pi * freq * t) * modulation
+    buf *= 10 ** (-15 / 20)  # Same -15 dB per-tone gain as before
+
+    voice_segment = AudioSegment(
+        (np.clip(buf, -1.0, 1.0) * 32767.0).astype(np.int16).tobytes(),
+        frame_rate=sample_rate, sample_width=2, channels=1
+    )
     
     return {
         'silence': silence,
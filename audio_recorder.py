@@ -5,22 +5,74 @@ Handles streaming audio capture with simple PCM audio level detection
 
 import os
 import json
+import tempfile
 import time
 import threading
 import requests
 import numpy as np
 import queue
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
 from datetime import datetime
 from datetime import timezone
 from pydub import AudioSegment
 import logging
+import re
 import subprocess
+import traceback
+
+# Optional fast JSON codec - metadata files are written once per saved
+# transmission, so serialization sits on the hot path of busy channels
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data):
+    """Parse JSON from bytes, preferring orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize to indented JSON bytes, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+# Compiled once; sanitize_name runs per channel on every config load
+_INVALID_CHARS_RE = re.compile(r'[^\w\-_.]')
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
+# Recording filenames start with the sortable timestamp from get_timestamp()
+_TS_PREFIX_RE = re.compile(r'\d{8}_\d{6}')
+
+
+def _parse_date_bound(value, end_of_day=False):
+    """Parse a date filter bound once, outside any per-file loop
+
+    A bare YYYY-MM-DD end bound is pushed to the end of that day so the
+    filter includes recordings made during it.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('T', ' '))
+    except Exception:
+        return None
+    if end_of_day and len(value) == 10:
+        parsed = parsed.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return parsed
+
+
 class AudioRecorder:
     def __init__(self, config_file="radio_channels.json", output_dir="audio_files"):
         self.config_file = config_file
@@ -40,6 +92,16 @@ class AudioRecorder:
         self.worker_threads = {}
         self.recording_threads = {}
 
+        # Shared pool for segment processing so the capture threads go
+        # straight back to streaming instead of blocking on decode/ffmpeg.
+        # Threads are enough here: the heavy lifting (MP3 decode, extraction)
+        # happens in ffmpeg subprocesses and numpy kernels, both of which
+        # release the GIL.
+        self._processing_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 2,
+            thread_name_prefix='segment-proc'
+        )
+
         # Simple audio processing settings
         self.chunk_duration = 45  # seconds - buffer size for processing
         self.min_transmission_length = 500  # ms (minimum 0.5 seconds)
@@ -47,9 +109,37 @@ class AudioRecorder:
         self.silence_gap = 4000  # ms between transmissions (4 seconds of silence before stopping)
         self.audio_padding = 400  # ms - extra padding at end of transmissions to capture fade-outs
 
+        # Per-channel output directory paths, built once instead of
+        # os.path.join'ing on every save/cleanup/listing
+        self._channel_dirs = {}
+
+        # Listing memo for get_recordings, invalidated by directory mtime
+        self._recordings_cache = {}
+
+        # Parsed metadata sidecars keyed by (path, mtime_ns); sidecars are
+        # write-once so entries stay valid for the life of the file
+        self._metadata_cache = {}
+
+        # Stage in-flight segments under the system temp dir (tmpfs on most
+        # Linux installs), so the raw stream bytes of cycles that turn out to
+        # contain no transmissions never touch the output disk
+        self.temp_dir = os.path.join(tempfile.gettempdir(), 'stream_recorder_temp')
+        os.makedirs(self.temp_dir, exist_ok=True)
+
         self.load_channels()
         self.ensure_output_directory()
 
+        # Shared HTTP session with a pool sized to the channel count:
+        # keep-alive lets the next 45s capture cycle reuse the TCP/TLS
+        # connection instead of paying a fresh handshake per cycle
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=max(10, len(self.channels)),
+            pool_maxsize=max(10, len(self.channels) * 2)
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
         # Clean up old temporary files on startup
         self.cleanup_temp_files(max_age_hours=1)
 
@@ -59,8 +149,8 @@ class AudioRecorder:
     def load_channels(self):
         """Load radio channels from JSON configuration"""
         try:
-            with open(self.config_file, "r") as f:
-                config = json.load(f)
+            with open(self.config_file, "rb") as f:
+                config = _json_loads(f.read())
 
             for channel in config.get("channels", []):
                 channel_name = channel.get("name", "")
@@ -83,21 +173,36 @@ class AudioRecorder:
             logger.error(f"Error loading channels: {e}")
             self.channels = {}
 
+    @staticmethod
+    def _samples_view(audio_segment):
+        """Zero-copy numpy view of an AudioSegment's raw PCM samples"""
+        int_dtype = {1: np.int8, 2: np.int16, 4: np.int32}.get(audio_segment.sample_width)
+        if int_dtype is None:
+            # Unexpected sample width - fall back to the copying path
+            return np.asarray(audio_segment.get_array_of_samples())
+        return np.frombuffer(audio_segment.raw_data, dtype=int_dtype)
+
     def calculate_rms_level(self, audio_segment):
         """Calculate RMS (Root Mean Square) level of audio in PCM"""
         try:
-            # Convert to numpy array
-            samples = np.array(audio_segment.get_array_of_samples(), dtype=np.float32)
+            # View the raw PCM bytes directly - get_array_of_samples()
+            # materializes a Python array.array and np.array() copies it
+            # again, while frombuffer is zero-copy
+            samples = self._samples_view(audio_segment)
+
+            if samples.size == 0:
+                return 0.0
 
-            # Normalize to [-1, 1] range
             if audio_segment.sample_width == 2:  # 16-bit
-                samples = samples / 32768.0
+                full_scale = 32768.0
             elif audio_segment.sample_width == 4:  # 32-bit
-                samples = samples / 2147483648.0
+                full_scale = 2147483648.0
+            else:
+                full_scale = 1.0
 
-            # Calculate RMS
-            rms = np.sqrt(np.mean(samples ** 2))
-            return rms
+            # Accumulate the power sum in float64 and normalize the scalar
+            rms = np.sqrt(np.einsum('i,i->', samples, samples, dtype=np.float64) / samples.size) / full_scale
+            return float(rms)
 
         except Exception as e:
             logger.error(f"Error calculating RMS level: {e}")
@@ -121,65 +226,141 @@ class AudioRecorder:
             logger.error(f"Error in audio activity detection: {e}")
             return False, "Detection error"
 
+    def _decode_pcm(self, filepath):
+        """Decode a recording to mono 16kHz 16-bit PCM through an ffmpeg pipe
+
+        pydub's from_file round-trips through a temporary WAV at the source
+        rate, so a 44.1kHz stereo segment costs ~6x the bytes this pipe
+        produces. The downsampled copy is only used for level detection -
+        extraction always reopens the original file.
+
+        Returns:
+            tuple: (samples, frame_rate) as (np.int16 array, int), or None
+                   if decoding fails.
+        """
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-v', 'quiet', '-i', filepath,
+                 '-f', 's16le', '-ac', '1', '-ar', '16000', '-'],
+                capture_output=True
+            )
+
+            if result.returncode != 0 or not result.stdout:
+                logger.warning(f"ffmpeg PCM decode failed for {filepath}, falling back to pydub")
+                return None
+
+            return np.frombuffer(result.stdout, dtype=np.int16), 16000
+
+        except Exception as e:
+            logger.error(f"Error decoding PCM from {filepath}: {e}")
+            return None
+
     def find_audio_segments(self, audio_segment, volume_sensitivity):
         """Find segments with audio activity using simple level detection"""
         try:
-            # Split audio into small chunks for analysis (100ms chunks)
-            chunk_size_ms = 100
-            segments = []
             duration_ms = len(audio_segment)
 
-            current_segment_start = None
-
-            for start_ms in range(0, duration_ms, chunk_size_ms):
-                end_ms = min(start_ms + chunk_size_ms, duration_ms)
-                chunk = audio_segment[start_ms:end_ms]
+            if duration_ms == 0:
+                return []
 
-                has_audio, _ = self.detect_audio_activity(chunk, volume_sensitivity)
+            samples = self._samples_view(audio_segment)
 
-                if has_audio:
-                    if current_segment_start is None:
-                        current_segment_start = start_ms
-                else:
-                    if current_segment_start is not None:
-                        # End of current segment - add padding to capture fade-outs
-                        original_end = start_ms
-                        padded_end = min(start_ms + self.audio_padding, duration_ms)
-                        segments.append((current_segment_start, padded_end))
-
-                        # Log padding application
-                        padding_applied = padded_end - original_end
-                        if padding_applied > 0:
-                            logger.debug(f"Applied {padding_applied}ms padding to segment ending at {original_end}ms")
-
-                        current_segment_start = None
-
-            # Handle segment that goes to the end
-            if current_segment_start is not None:
-                segments.append((current_segment_start, duration_ms))
-
-            # Merge segments that are close together (within silence_gap)
-            merged_segments = []
-            for start_ms, end_ms in segments:
-                if merged_segments and (start_ms - merged_segments[-1][1]) < self.silence_gap:
-                    # Merge with previous segment
-                    merged_segments[-1] = (merged_segments[-1][0], end_ms)
-                else:
-                    merged_segments.append((start_ms, end_ms))
+            if audio_segment.sample_width == 2:  # 16-bit
+                full_scale = 32768.0
+            elif audio_segment.sample_width == 4:  # 32-bit
+                full_scale = 2147483648.0
+            else:
+                full_scale = 1.0
 
-            return merged_segments
+            # 100ms analysis chunks
+            chunk_len = max(1, int(audio_segment.frame_rate * audio_segment.channels * 100 / 1000))
+            return self._find_segments_in_samples(samples, chunk_len, duration_ms, full_scale, volume_sensitivity)
 
         except Exception as e:
             logger.error(f"Error finding audio segments: {e}")
             return []
 
+    def _find_segments_in_samples(self, samples, chunk_len, duration_ms, full_scale, volume_sensitivity):
+        """Find active segments in a flat sample array (100ms chunk RMS)
+
+        The vectorized core behind find_audio_segments, split out so the
+        ffmpeg pipe decode path can run detection without building an
+        AudioSegment at all.
+        """
+        try:
+            chunk_size_ms = 100
+
+            if duration_ms == 0 or samples.size == 0:
+                return []
+
+            # Compute the RMS of every 100ms chunk in one pass instead of
+            # slicing and recomputing per chunk: reshape the samples into a
+            # (n_chunks, chunk_len) matrix and let einsum produce all the
+            # squared sums at once. The power sums are taken on the raw
+            # integer samples (RMS is scale-invariant), so the normalization
+            # happens once on the small per-chunk array rather than in a
+            # float32 copy of the whole buffer - half the bytes moved for
+            # 16-bit audio.
+            n_chunks = -(-len(samples) // chunk_len)
+
+            padded = np.zeros(n_chunks * chunk_len, dtype=samples.dtype)
+            padded[:len(samples)] = samples
+            frames = padded.reshape(n_chunks, chunk_len)
+
+            # The final chunk may be shorter than chunk_len; divide by the
+            # real sample counts so its RMS matches the unpadded value.
+            counts = np.full(n_chunks, chunk_len, dtype=np.float64)
+            counts[-1] = len(samples) - (n_chunks - 1) * chunk_len
+
+            # float64 accumulation: int16**2 sums overflow int32 and the
+            # einsum would otherwise accumulate in the input dtype
+            sq_sums = np.einsum('ij,ij->i', frames, frames, dtype=np.float64)
+            rms_per_chunk = np.sqrt(sq_sums / counts) / full_scale
+            has_audio_per_chunk = rms_per_chunk > volume_sensitivity
+
+            # Extract the active runs without walking chunk by chunk: an
+            # edge of +1 in the zero-padded diff marks a run start and -1
+            # marks the chunk after it ends, so one diff plus two
+            # flatnonzero calls replaces the per-chunk Python loop.
+            edges = np.diff(np.r_[np.int8(0), has_audio_per_chunk.view(np.int8), np.int8(0)])
+            run_starts = np.flatnonzero(edges == 1)
+            run_ends = np.flatnonzero(edges == -1)
+
+            if run_starts.size == 0:
+                return []
+
+            starts_ms = run_starts.astype(np.int64) * chunk_size_ms
+            # Pad every segment end to capture fade-outs, clamped to the
+            # recording length (a run reaching the final chunk ends exactly
+            # at duration_ms, as before)
+            ends_ms = np.minimum(run_ends.astype(np.int64) * chunk_size_ms + self.audio_padding, duration_ms)
+
+            if starts_ms.size == 1:
+                return [(int(starts_ms[0]), int(ends_ms[0]))]
+
+            # Merge segments that are close together (within silence_gap).
+            # Vectorized interval merge: a segment opens a new group exactly
+            # when its gap to the previous segment's end reaches silence_gap,
+            # so the group boundaries fall out of one comparison and reduceat
+            # collapses each group without a Python-level loop.
+            gaps = starts_ms[1:] - ends_ms[:-1]
+            group_starts = np.flatnonzero(np.concatenate(([True], gaps >= self.silence_gap)))
+
+            merged_starts = starts_ms[group_starts]
+            merged_ends = np.maximum.reduceat(ends_ms, group_starts)
+
+            return list(zip(merged_starts.tolist(), merged_ends.tolist()))
+
+        except Exception as e:
+            logger.error(f"Error finding audio segments in samples: {e}")
+            return []
+
     def sanitize_name(self, name):
         """Convert channel name to safe filename"""
-        import re
         # Replace spaces and special characters with underscores
-        sanitized = re.sub(r'[^\w\-_.]', '_', name)
+        sanitized = _INVALID_CHARS_RE.sub('_', name)
         # Remove multiple consecutive underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
+        sanitized = _UNDERSCORE_RUN_RE.sub('_', sanitized)
         # Remove leading/trailing underscores
         sanitized = sanitized.strip('_')
         return sanitized
@@ -189,11 +370,18 @@ class AudioRecorder:
         try:
             os.makedirs(self.output_dir, exist_ok=True)
             for channel_id in self.channels:
-                channel_dir = os.path.join(self.output_dir, channel_id)
-                os.makedirs(channel_dir, exist_ok=True)
+                os.makedirs(self._channel_dir(channel_id), exist_ok=True)
         except Exception as e:
             logger.error(f"Error creating directories: {e}")
 
+    def _channel_dir(self, channel_id):
+        """Cached output directory path for a channel"""
+        path = self._channel_dirs.get(channel_id)
+        if path is None:
+            path = os.path.join(self.output_dir, channel_id)
+            self._channel_dirs[channel_id] = path
+        return path
+
     def get_timestamp(self):
         """Generate timestamp for filenames"""
         return datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
@@ -201,7 +389,7 @@ class AudioRecorder:
     def save_transmission_ffmpeg(self, source_file, start_ms, end_ms, channel_id, timestamp):
         """Save transmission using ffmpeg for precise extraction"""
         try:
-            channel_dir = os.path.join(self.output_dir, channel_id)
+            channel_dir = self._channel_dir(channel_id)
             output_file = os.path.join(channel_dir, f"{timestamp}_{channel_id}.flac")
 
             # Convert milliseconds to seconds for ffmpeg
@@ -212,7 +400,8 @@ class AudioRecorder:
 
             # FFmpeg command to extract segment with FLAC encoding
             cmd = [
-                'ffmpeg', '-y', '-i', source_file,
+                'ffmpeg', '-nostdin', '-hide_banner', '-loglevel', 'error',
+                '-y', '-i', source_file,
                 '-ss', str(start_sec),
                 '-t', str(duration_sec),
                 '-c:a', 'flac',  # Use FLAC encoding
@@ -222,22 +411,9 @@ class AudioRecorder:
             result = subprocess.run(cmd, capture_output=True, text=True)
 
             if result.returncode == 0:
-                # Create metadata file
-                metadata = {
-                    "channel": self.channels[channel_id]["name"],
-                    "timestamp": timestamp,
-                    "duration_ms": end_ms - start_ms,
-                    "start_time": datetime.now(timezone.utc).isoformat(),
-                    "source_file": os.path.basename(source_file),
-                    "extraction_method": "ffmpeg_flac"
-                }
-
-                metadata_file = output_file.replace('.flac', '_metadata.json')
-                with open(metadata_file, 'w') as f:
-                    json.dump(metadata, f, indent=2)
+                self._write_transmission_metadata(output_file, source_file, channel_id, timestamp, end_ms - start_ms)
 
                 logger.info(f"Successfully extracted transmission: {output_file}")
-                logger.info(f"Created metadata: {metadata_file}")
 
                 return output_file
             else:
@@ -248,62 +424,166 @@ class AudioRecorder:
             logger.error(f"Error saving transmission with ffmpeg: {e}")
             return None
 
+    def _write_transmission_metadata(self, output_file, source_file, channel_id, timestamp, duration_ms):
+        """Write the metadata JSON that accompanies a saved transmission"""
+        metadata = {
+            "channel": self.channels[channel_id]["name"],
+            "timestamp": timestamp,
+            "duration_ms": duration_ms,
+            "start_time": datetime.now(timezone.utc).isoformat(),
+            "source_file": os.path.basename(source_file),
+            "extraction_method": "ffmpeg_flac"
+        }
+
+        # output_file is known to end in '.flac'; slicing beats a full scan
+        metadata_file = output_file[:-5] + '_metadata.json'
+        with open(metadata_file, 'wb') as f:
+            f.write(_json_dumps(metadata))
+
+        logger.info(f"Created metadata: {metadata_file}")
+
+    def save_transmissions_ffmpeg(self, source_file, ranges, channel_id):
+        """Extract several transmissions from one source in a single ffmpeg run
+
+        ffmpeg startup (fork/exec plus codec registry init) costs tens of
+        milliseconds, so for a segment with several transmissions one
+        invocation with multiple -ss/-t output groups is much cheaper than
+        one process per transmission.
+
+        Args:
+            ranges: List of (start_ms, end_ms, timestamp) tuples.
+
+        Returns:
+            list: Paths of the transmissions that were saved.
+        """
+        try:
+            channel_dir = self._channel_dir(channel_id)
+
+            cmd = ['ffmpeg', '-nostdin', '-hide_banner', '-loglevel', 'error', '-y', '-i', source_file]
+            output_files = []
+            for start_ms, end_ms, timestamp in ranges:
+                output_file = os.path.join(channel_dir, f"{timestamp}_{channel_id}.flac")
+                cmd.extend([
+                    '-ss', str(start_ms / 1000.0),
+                    '-t', str((end_ms - start_ms) / 1000.0),
+                    '-c:a', 'flac',
+                    output_file
+                ])
+                output_files.append(output_file)
+
+            logger.info(f"Extracting {len(ranges)} transmission(s) from {os.path.basename(source_file)} in one ffmpeg run")
+
+            result = subprocess.run(cmd, capture_output=True, text=True)
+
+            if result.returncode != 0:
+                logger.error(f"Batch ffmpeg extraction failed, retrying individually: {result.stderr}")
+                # Fall back to one process per range so a single bad range
+                # cannot lose the whole segment
+                saved_files = []
+                for start_ms, end_ms, timestamp in ranges:
+                    saved = self.save_transmission_ffmpeg(source_file, start_ms, end_ms, channel_id, timestamp)
+                    if saved:
+                        saved_files.append(saved)
+                return saved_files
+
+            saved_files = []
+            for (start_ms, end_ms, timestamp), output_file in zip(ranges, output_files):
+                if not os.path.exists(output_file):
+                    logger.warning(f"Batch ffmpeg run did not produce {output_file}")
+                    continue
+
+                self._write_transmission_metadata(output_file, source_file, channel_id, timestamp, end_ms - start_ms)
+                logger.info(f"Successfully extracted transmission: {output_file}")
+                saved_files.append(output_file)
+
+            return saved_files
+
+        except Exception as e:
+            logger.error(f"Error batch-saving transmissions with ffmpeg: {e}")
+            return []
+
     def process_audio_segment(self, filepath, channel_id):
         """Process audio segment with simple level-based detection"""
         try:
             logger.info(f"Processing complete segment for {channel_id}: {filepath}")
-
-            # Load audio file
-            audio_segment = AudioSegment.from_file(filepath)
             logger.info(f"File size: {os.path.getsize(filepath)} bytes")
-            logger.info(f"Loaded audio segment: {len(audio_segment)}ms, {audio_segment.frame_rate}Hz, {audio_segment.channels} channels")
 
             # Get channel-specific volume sensitivity
             volume_sensitivity = self.channels[channel_id].get("volume_sensitivity", 0.01)
 
-            # Calculate overall audio levels for logging
-            rms_level = self.calculate_rms_level(audio_segment)
-            max_db = audio_segment.max_dBFS if len(audio_segment) > 0 else -float('inf')
+            # Decode straight to mono 16kHz PCM for detection; extraction
+            # below reopens the original file at full quality
+            decoded = self._decode_pcm(filepath)
+
+            if decoded is not None:
+                samples, frame_rate = decoded
+                duration_ms = samples.size * 1000 // frame_rate
+
+                rms_level = float(np.sqrt(np.einsum('i,i->', samples, samples, dtype=np.float64) / samples.size) / 32768.0)
+                logger.info(f"Decoded audio segment: {duration_ms}ms at {frame_rate}Hz mono, RMS={rms_level:.4f}")
+                logger.info(f"Volume sensitivity threshold: {volume_sensitivity}")
+                logger.info(f"Audio padding enabled: {self.audio_padding}ms")
+
+                chunk_len = max(1, frame_rate // 10)  # 100ms of mono samples
+                audio_segments = self._find_segments_in_samples(
+                    samples, chunk_len, duration_ms, 32768.0, volume_sensitivity
+                )
+            else:
+                # Fall back to the pydub load if the pipe decode failed
+                audio_segment = AudioSegment.from_file(filepath)
+                logger.info(f"Loaded audio segment: {len(audio_segment)}ms, {audio_segment.frame_rate}Hz, {audio_segment.channels} channels")
+
+                rms_level = self.calculate_rms_level(audio_segment)
+                max_db = audio_segment.max_dBFS if len(audio_segment) > 0 else -float('inf')
 
-            logger.info(f"Audio levels: max_dBFS={max_db:.1f}, RMS={rms_level:.4f}")
-            logger.info(f"Volume sensitivity threshold: {volume_sensitivity}")
-            logger.info(f"Audio padding enabled: {self.audio_padding}ms")
+                logger.info(f"Audio levels: max_dBFS={max_db:.1f}, RMS={rms_level:.4f}")
+                logger.info(f"Volume sensitivity threshold: {volume_sensitivity}")
+                logger.info(f"Audio padding enabled: {self.audio_padding}ms")
 
-            # Find audio segments
-            audio_segments = self.find_audio_segments(audio_segment, volume_sensitivity)
+                audio_segments = self.find_audio_segments(audio_segment, volume_sensitivity)
 
             logger.info(f"Found {len(audio_segments)} audio segments")
 
-            saved_count = 0
             filtered_count = 0
 
-            # Process each detected audio segment
+            # Filter by transmission length, then extract every surviving
+            # range with a single batched ffmpeg invocation
+            valid_ranges = []
+            filtered_ranges = []
+            used_timestamps = set()
             for start_ms, end_ms in audio_segments:
                 transmission_length = end_ms - start_ms
-                logger.info(f"Audio segment detected: {transmission_length}ms (range: {start_ms}-{end_ms})")
 
-                # Filter by transmission length
                 if self.min_transmission_length <= transmission_length <= self.max_transmission_length:
-                    # Save the transmission
+                    # Timestamps have millisecond resolution and are generated
+                    # back-to-back here, so guard against collisions
                     timestamp = self.get_timestamp()
-                    saved_file = self.save_transmission_ffmpeg(filepath, start_ms, end_ms, channel_id, timestamp)
-
-                    if saved_file:
-                        logger.info(f"Saved transmission: {saved_file} (RMS: {rms_level:.4f})")
-                        saved_count += 1
-                    else:
-                        logger.warning("Failed to save transmission with ffmpeg")
-                        filtered_count += 1
+                    while timestamp in used_timestamps:
+                        time.sleep(0.001)
+                        timestamp = self.get_timestamp()
+                    used_timestamps.add(timestamp)
+                    valid_ranges.append((start_ms, end_ms, timestamp))
                 else:
-                    logger.info(f"Transmission filtered out: {transmission_length}ms (too short/long)")
+                    filtered_ranges.append((start_ms, end_ms))
                     filtered_count += 1
 
+            # One summary line instead of one or two f-strings per range;
+            # %s-style arguments keep formatting out of the disabled path
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Detected ranges (ms): %s; %d filtered by length: %s",
+                    [(s, e) for s, e, _ in valid_ranges], filtered_count, filtered_ranges
+                )
+
+            saved_files = self.save_transmissions_ffmpeg(filepath, valid_ranges, channel_id) if valid_ranges else []
+            saved_count = len(saved_files)
+            filtered_count += len(valid_ranges) - saved_count
+
             logger.info(f"Segment processing complete: {saved_count} transmissions saved, {filtered_count} filtered out")
             logger.info(f"Successfully processed segment for {channel_id}")
 
         except Exception as e:
             logger.error(f"Error processing audio segment: {e}")
-            import traceback
             traceback.print_exc()
 
         finally:
@@ -327,36 +607,46 @@ class AudioRecorder:
         try:
             current_time = time.time()
             max_age_seconds = max_age_hours * 3600
-            removed_count = 0
+            removed_paths = []
+
+            # Sweep the staging directory plus the channel directories (the
+            # latter may still hold temp files written by older versions)
+            scan_dirs = [self.temp_dir] + [self._channel_dir(cid) for cid in self.channels]
+
+            for scan_dir in scan_dirs:
+                if not os.path.isdir(scan_dir):
+                    continue
+
+                # One scandir pass: DirEntry.stat() reuses the metadata the
+                # directory read already fetched on most platforms, halving
+                # the stat syscalls of the old listdir + getmtime loop
+                with os.scandir(scan_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.startswith('temp_'):
+                            continue
+                        try:
+                            if max_age_hours == 0:
+                                # Force cleanup all temp files
+                                os.remove(entry.path)
+                                removed_paths.append(entry.path)
+                            else:
+                                # Check age before removal
+                                file_age = current_time - entry.stat().st_mtime
+                                if file_age > max_age_seconds:
+                                    os.remove(entry.path)
+                                    removed_paths.append(entry.path)
+                        except Exception as e:
+                            logger.warning(f"Failed to remove temp file {entry.path}: {e}")
 
-            for channel_id in self.channels:
-                channel_dir = os.path.join(self.output_dir, channel_id)
-                if os.path.exists(channel_dir):
-                    for filename in os.listdir(channel_dir):
-                        if filename.startswith('temp_'):
-                            filepath = os.path.join(channel_dir, filename)
-                            try:
-                                if max_age_hours == 0:
-                                    # Force cleanup all temp files
-                                    os.remove(filepath)
-                                    logger.info(f"Removed temp file: {filepath}")
-                                    removed_count += 1
-                                else:
-                                    # Check age before removal
-                                    file_age = current_time - os.path.getmtime(filepath)
-                                    if file_age > max_age_seconds:
-                                        os.remove(filepath)
-                                        logger.info(f"Removed old temp file: {filepath}")
-                                        removed_count += 1
-                            except Exception as e:
-                                logger.warning(f"Failed to remove temp file {filepath}: {e}")
-
-            if removed_count > 0:
-                logger.info(f"Cleanup complete: removed {removed_count} temporary files")
+            # One summary line per pass instead of a log record per file;
+            # lazy %s args keep formatting off the common empty path
+            if removed_paths:
+                logger.info("Cleanup complete: removed %d temporary files: %s",
+                            len(removed_paths), removed_paths[:10])
             else:
                 logger.info("No temporary files found to remove")
 
-            return removed_count
+            return len(removed_paths)
 
         except Exception as e:
             logger.error(f"Error during temp file cleanup: {e}")
@@ -364,15 +654,23 @@ class AudioRecorder:
 
     def start_cleanup_scheduler(self):
         """Start background cleanup scheduler"""
+        # Event.wait instead of time.sleep so the scheduler can be stopped
+        # promptly (shutdown, tests) rather than blocking up to an hour
+        self._cleanup_stop = threading.Event()
+
         def cleanup_worker():
-            while True:
-                time.sleep(3600)  # Run every hour
+            while not self._cleanup_stop.wait(3600):  # Run every hour
                 self.cleanup_temp_files()
 
         cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
         cleanup_thread.start()
         logger.info("Background temp file cleanup scheduler started")
 
+    def stop_cleanup_scheduler(self):
+        """Stop the background cleanup scheduler"""
+        if hasattr(self, '_cleanup_stop'):
+            self._cleanup_stop.set()
+
     def start_recording(self, channel_ids):
         """Start recording for specified channels"""
         for channel_id in channel_ids:
@@ -445,13 +743,12 @@ class AudioRecorder:
 
         while self.is_recording.get(channel_id, False):
             try:
-                # Create temp file for this segment
+                # Create temp file for this segment in the staging directory
                 timestamp = self.get_timestamp()
-                channel_dir = os.path.join(self.output_dir, channel_id)
-                temp_file = os.path.join(channel_dir, f"temp_{timestamp}_{channel_id}.mp3")
+                temp_file = os.path.join(self.temp_dir, f"temp_{timestamp}_{channel_id}.mp3")
 
                 # Stream audio and save to temp file
-                response = requests.get(
+                response = self._session.get(
                     url,
                     stream=True,
                     timeout=30,
@@ -466,25 +763,35 @@ class AudioRecorder:
                     bytes_written = 0
                     start_time = time.time()
 
-                    with open(temp_file, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if not self.is_recording.get(channel_id, False):
+                    # Read up to 64 KiB at a time into a preallocated buffer
+                    # (readinto fills it in place, so the loop allocates
+                    # nothing per read) and let a 1 MiB io buffer coalesce the
+                    # writes. decode_content keeps any content-encoding
+                    # handling that iter_content used to do.
+                    response.raw.decode_content = True
+                    read_view = memoryview(bytearray(1 << 16))
+
+                    with open(temp_file, 'wb', buffering=1 << 20) as f:
+                        while self.is_recording.get(channel_id, False):
+                            n = response.raw.readinto(read_view)
+                            if not n:
                                 break
 
-                            if chunk:
-                                f.write(chunk)
-                                bytes_written += len(chunk)
+                            f.write(read_view[:n])
+                            bytes_written += n
 
-                            # Check if we've reached our chunk duration
+                            # Reads are seconds apart at typical stream
+                            # bitrates, so the duration check stays per-read
                             if time.time() - start_time >= self.chunk_duration:
                                 break
 
                     elapsed_time = time.time() - start_time
                     logger.info(f"Finished recording segment for {channel_id}: {bytes_written} bytes written in {elapsed_time:.1f}s")
 
-                    # Process the recorded segment
+                    # Hand the recorded segment to the processing pool so the
+                    # next capture cycle starts immediately
                     if bytes_written > 0:
-                        self.process_audio_segment(temp_file, channel_id)
+                        self._processing_pool.submit(self.process_audio_segment, temp_file, channel_id)
                     else:
                         # Remove empty temp file
                         try:
@@ -499,107 +806,269 @@ class AudioRecorder:
                 logger.error(f"Error recording {channel_id}: {e}")
                 time.sleep(5)  # Wait before retrying
 
-    def get_recordings(self, channel_id=None, limit=50):
-        """Get list of recordings"""
-        recordings = []
+    def get_recordings(self, channel_id=None, limit=50, start_date=None, end_date=None, search_text=None):
+        """Get list of recordings with optional date and channel-name filters
 
-        channels_to_check = [channel_id] if channel_id else self.channels.keys()
-
-        for ch_id in channels_to_check:
-            channel_dir = os.path.join(self.output_dir, ch_id)
-            if os.path.exists(channel_dir):
-                files = os.listdir(channel_dir)
-                flac_files = [f for f in files if f.endswith('.flac') and not f.startswith('temp_')]
-                flac_files.sort(reverse=True)  # Most recent first
-
-                for filename in flac_files[:limit]:
-                    filepath = os.path.join(channel_dir, filename)
-                    stat = os.stat(filepath)
-
-                    recording_info = {
-                        'filename': filename,
-                        'channel_id': ch_id,
-                        'channel_name': self.channels[ch_id]['name'],
-                        'file_size': stat.st_size,
-                        'created_time': datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc).isoformat(),
-                        'modified_time': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
-                        'file_path': filepath
-                    }
+        Results are memoized against the channel directories' mtimes, so
+        repeated dashboard polls with the same filters are served from
+        memory until a recording is added or removed.
+        """
+        cache_key = (channel_id, limit, start_date, end_date, search_text)
+
+        # A directory's mtime changes on any file add/remove, which makes
+        # the mtime tuple a cheap content fingerprint for invalidation
+        dir_signature = tuple(
+            (ch_id, os.stat(self._channel_dir(ch_id)).st_mtime_ns)
+            for ch_id in ([channel_id] if channel_id else self.channels.keys())
+            if os.path.isdir(self._channel_dir(ch_id))
+        )
+
+        cached = self._recordings_cache.get(cache_key)
+        if cached is not None and cached[0] == dir_signature:
+            return cached[1]
+
+        recordings = self._collect_recordings(channel_id, limit, start_date, end_date, search_text)
+
+        if len(self._recordings_cache) >= 128:
+            self._recordings_cache.clear()
+        self._recordings_cache[cache_key] = (dir_signature, recordings)
+
+        return recordings
+
+    def _collect_recordings(self, channel_id, limit, start_date, end_date, search_text):
+        """Scan the channel directories and build the recordings list"""
+        # Parse the filter bounds once instead of per file, and render them
+        # as filename-timestamp keys so the per-file check is a string compare
+        start_dt = _parse_date_bound(start_date)
+        end_dt = _parse_date_bound(end_date, end_of_day=True)
+        start_key = start_dt.strftime('%Y%m%d_%H%M%S') if start_dt else None
+        end_key = end_dt.strftime('%Y%m%d_%H%M%S') if end_dt else None
+
+        # Prune channels against the search filter before touching the
+        # filesystem, lowercasing the needle once rather than per channel
+        needle = search_text.lower() if search_text else None
+        channels_to_check = [channel_id] if channel_id else list(self.channels.keys())
+        if needle is not None:
+            channels_to_check = [
+                ch_id for ch_id in channels_to_check
+                if needle in self.channels.get(ch_id, {}).get('name', '').lower()
+            ]
 
-                    # Load metadata if available
-                    metadata_file = filepath.replace('.flac', '_metadata.json')
-                    if os.path.exists(metadata_file):
-                        try:
-                            with open(metadata_file, 'r') as f:
-                                metadata = json.load(f)
-                            recording_info.update(metadata)
-                        except Exception as e:
-                            logger.warning(f"Failed to load metadata from {metadata_file}: {e}")
+        def channel_records(ch_id):
+            """Yield one channel's recordings newest-first"""
+            channel_dir = self._channel_dir(ch_id)
+            if not os.path.isdir(channel_dir):
+                return
+
+            # One scandir pass per channel: DirEntry carries the name, path
+            # and cached stat data in a single directory read, and keeping
+            # the whole listing keyed by name turns the metadata sidecar
+            # existence check into a dict lookup instead of another stat
+            with os.scandir(channel_dir) as it:
+                entries = {entry.name: entry for entry in it}
+
+            # A single C-level suffix check per name: temp files are
+            # temp_*.mp3, so the .flac test already excludes them
+            flac_files = [name for name in entries if name.endswith('.flac')]
+            flac_files.sort(reverse=True)  # Most recent first
+
+            # One lookup per channel instead of two chained .get()s per file
+            channel_name = self.channels.get(ch_id, {}).get('name', ch_id)
+
+            # Walk the full newest-first listing and stop only after limit
+            # *matching* rows: slicing the file list before filtering would
+            # make any date window older than the newest limit files come
+            # back empty
+            yielded = 0
+
+            for filename in flac_files:
+                if yielded >= limit:
+                    break
+
+                # Apply date filtering on the sortable filename timestamp
+                # before paying for the stat: the leading YYYYMMDD_HHMMSS
+                # sorts lexicographically, so comparing it against the
+                # precomputed keys avoids a strptime-style conversion per
+                # file; names without the timestamp prefix fall back to the
+                # mtime check below
+                has_ts_prefix = _TS_PREFIX_RE.match(filename) is not None
+                if has_ts_prefix:
+                    timestamp_str = filename[:15]
+                    if start_key and timestamp_str < start_key:
+                        continue
+                    if end_key and timestamp_str > end_key:
+                        continue
+
+                entry = entries[filename]
+                stat = entry.stat()
+
+                if not has_ts_prefix:
+                    modified_naive = datetime.fromtimestamp(stat.st_mtime)
+                    if start_dt and modified_naive < start_dt:
+                        continue
+                    if end_dt and modified_naive > end_dt:
+                        continue
+
+                recording_info = {
+                    'filename': filename,
+                    'channel_id': ch_id,
+                    'channel_name': channel_name,
+                    'file_size': stat.st_size,
+                    'created_time': datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc).isoformat(),
+                    'modified_time': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
+                    'file_path': entry.path
+                }
 
-                    recordings.append(recording_info)
+                # Remember the sidecar path; the JSON itself is read only
+                # for the rows that survive the final sort and slice
+                metadata_entry = entries.get(filename[:-5] + '_metadata.json')
+                if metadata_entry is not None:
+                    recording_info['_metadata_path'] = (metadata_entry.path, metadata_entry.stat().st_mtime_ns)
+
+                yielded += 1
+                yield recording_info
+
+        # Each channel generator is already sorted newest-first, so a k-way
+        # heapq.merge keyed on the timestamp-prefixed filename replaces the
+        # collect-everything-then-Timsort step; islice stops the merge as
+        # soon as limit rows have been produced, and the generators behind
+        # it never stat the files that are not needed
+        merged = heapq.merge(
+            *(channel_records(ch_id) for ch_id in channels_to_check),
+            key=itemgetter('filename'), reverse=True
+        )
+        recordings = list(islice(merged, limit))
+
+        # Enrich only the rows actually being returned
+        self._load_page_metadata(recordings)
+
+        return recordings
+
+    def _load_page_metadata(self, page):
+        """Load the metadata sidecars for a page of recordings concurrently
+
+        The reads are independent small-file I/Os, so overlapping them on
+        the shared pool hides the per-file open/read latency - most
+        noticeable on network or spinning-disk storage.
+        """
+        if len(page) > 1:
+            # list() drains the iterator so every row is loaded on return
+            list(self._processing_pool.map(self._load_recording_metadata, page))
+        elif page:
+            self._load_recording_metadata(page[0])
+
+    def _load_recording_metadata(self, recording_info):
+        """Merge a recording's metadata sidecar into its dict, if present
+
+        Parsed sidecars are cached keyed on (path, mtime): the JSON is
+        written once when the transmission is saved and never touched
+        again, so when a listing page is polled the cache serves every
+        row without reopening or reparsing the file. The mtime in the key
+        comes from the listing's scandir pass, so staleness costs no
+        extra stat.
+        """
+        metadata_key = recording_info.pop('_metadata_path', None)
+        if not metadata_key:
+            return
 
-        return sorted(recordings, key=lambda x: x['modified_time'], reverse=True)[:limit]
+        cached = self._metadata_cache.get(metadata_key)
+        if cached is not None:
+            recording_info.update(cached)
+            return
+
+        metadata_path = metadata_key[0]
+        try:
+            with open(metadata_path, 'rb') as f:
+                metadata = _json_loads(f.read())
+        except Exception as e:
+            logger.warning(f"Failed to load metadata from {metadata_path}: {e}")
+            return
+
+        # Simple FIFO eviction keeps the cache bounded; dicts iterate in
+        # insertion order so the oldest entry is first
+        if len(self._metadata_cache) >= 4096:
+            self._metadata_cache.pop(next(iter(self._metadata_cache)), None)
+        self._metadata_cache[metadata_key] = metadata
+
+        recording_info.update(metadata)
 
     def get_channel_recordings(self, channel_id, limit=50, offset=0, start_date=None, end_date=None):
         """Get recordings for a specific channel with filtering options"""
         recordings = []
 
-        channel_dir = os.path.join(self.output_dir, channel_id)
-        if not os.path.exists(channel_dir):
+        channel_dir = self._channel_dir(channel_id)
+        if not os.path.isdir(channel_dir):
             return recordings
 
-        files = os.listdir(channel_dir)
-        flac_files = [f for f in files if f.endswith('.flac') and not f.startswith('temp_')]
+        # One scandir pass: DirEntry carries the name, path and cached stat
+        # data in a single directory read, and keeping the whole listing
+        # keyed by name turns the metadata sidecar existence check into a
+        # dict lookup instead of another stat
+        with os.scandir(channel_dir) as it:
+            entries = {entry.name: entry for entry in it}
+
+        # temp files are temp_*.mp3, so the .flac test already excludes them
+        flac_files = [name for name in entries if name.endswith('.flac')]
         flac_files.sort(reverse=True)  # Most recent first
 
-        # Parse date filters
-        start_dt = None
-        end_dt = None
-        if start_date:
-            try:
-                start_dt = datetime.fromisoformat(start_date.replace('T', ' '))
-            except Exception:
-                pass
-        if end_date:
-            try:
-                end_dt = datetime.fromisoformat(end_date.replace('T', ' '))
-            except Exception:
-                pass
+        # One lookup per channel instead of two chained .get()s per file
+        channel_name = self.channels.get(channel_id, {}).get('name', channel_id)
+
+        # Parse date filters once and render them as filename-timestamp keys
+        start_dt = _parse_date_bound(start_date)
+        end_dt = _parse_date_bound(end_date, end_of_day=True)
+        start_key = start_dt.strftime('%Y%m%d_%H%M%S') if start_dt else None
+        end_key = end_dt.strftime('%Y%m%d_%H%M%S') if end_dt else None
+
+        # Files are sorted newest-first, so collection can stop as soon as
+        # enough records exist to serve the requested page - every file
+        # past offset+limit would be sliced away anyway
+        needed = offset + limit
 
         for filename in flac_files:
-            filepath = os.path.join(channel_dir, filename)
-            stat = os.stat(filepath)
+            if len(recordings) >= needed:
+                break
+
+            # Filter on the sortable filename timestamp before paying for
+            # the stat; names without the prefix fall back to mtime below
+            has_ts_prefix = _TS_PREFIX_RE.match(filename) is not None
+            if has_ts_prefix:
+                timestamp_str = filename[:15]
+                if start_key and timestamp_str < start_key:
+                    continue
+                if end_key and timestamp_str > end_key:
+                    continue
+
+            entry = entries[filename]
+            stat = entry.stat()
             modified_time = datetime.fromtimestamp(stat.st_mtime)
 
-            # Apply date filtering
-            if start_dt and modified_time < start_dt:
-                continue
-            if end_dt and modified_time > end_dt:
-                continue
+            if not has_ts_prefix:
+                if start_dt and modified_time < start_dt:
+                    continue
+                if end_dt and modified_time > end_dt:
+                    continue
 
             recording_info = {
                 'filename': filename,
                 'channel_id': channel_id,
-                'channel_name': self.channels.get(channel_id, {}).get('name', channel_id),
+                'channel_name': channel_name,
                 'file_size': stat.st_size,
                 'created_time': datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc).isoformat(),
                 'modified_time': modified_time.astimezone(timezone.utc).isoformat(),
-                'file_path': filepath
+                'file_path': entry.path
             }
 
-            # Load metadata if available
-            metadata_file = filepath.replace('.flac', '_metadata.json')
-            if os.path.exists(metadata_file):
-                try:
-                    with open(metadata_file, 'r') as f:
-                        metadata = json.load(f)
-                    recording_info.update(metadata)
-                except Exception as e:
-                    logger.warning(f"Failed to load metadata from {metadata_file}: {e}")
+            # Remember the sidecar path; the JSON is read only for the
+            # page that is actually returned
+            metadata_entry = entries.get(filename[:-5] + '_metadata.json')
+            if metadata_entry is not None:
+                recording_info['_metadata_path'] = (metadata_entry.path, metadata_entry.stat().st_mtime_ns)
 
             recordings.append(recording_info)
 
-        # Apply offset and limit
-        start_idx = offset
-        end_idx = offset + limit
-        return recordings[start_idx:end_idx]
+        # Apply offset and limit, then enrich just that page
+        page = recordings[offset:offset + limit]
+        self._load_page_metadata(page)
+
+        return page
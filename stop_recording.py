@@ -9,6 +9,11 @@ import logging
 import requests
 import time
 
+try:
+    import psutil
+except ImportError:  # psutil is optional - fall back to pgrep/os.kill
+    psutil = None
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +26,10 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Module-level session: connection pooling/keep-alive, and a single place to
+# configure transport behavior for every API call this script makes
+_SESSION = requests.Session()
+
 def main():
     """Main stop recording function"""
     logger.info("🛑 Stopping Police Radio Audio Logger")
@@ -32,7 +41,9 @@ def main():
         
         logger.info("Attempting to stop recording via API...")
         
-        response = requests.post(api_url, timeout=10)
+        # Split connect/read timeouts: fail within a second when the daemon
+        # isn't up so the process-termination fallback runs promptly
+        response = _SESSION.post(api_url, timeout=(1, 5))
         
         if response.status_code == 200:
             result = response.json()
@@ -43,7 +54,7 @@ def main():
             # Fall back to process termination
             terminate_processes()
             
-    except requests.exceptions.ConnectionError:
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
         logger.warning("Could not connect to Flask app API")
         # Fall back to process termination
         terminate_processes()
@@ -54,19 +65,46 @@ def main():
 
 def terminate_processes():
     """Terminate recording processes by finding and killing them"""
-    import subprocess
-    import os
-    
     try:
         logger.info("Attempting to terminate recording processes...")
-        
-        # Find processes running start_recording.py
+
+        if psutil is not None:
+            # Signal every recorder at once and wait on the whole group -
+            # one shared timeout instead of a serial SIGTERM+sleep per pid
+            targets = []
+            for proc in psutil.process_iter(['cmdline']):
+                cmdline = proc.info['cmdline']
+                if cmdline and 'start_recording.py' in ' '.join(cmdline):
+                    targets.append(proc)
+
+            if not targets:
+                logger.info("No recording processes found")
+                return
+
+            for proc in targets:
+                logger.info(f"Terminating process {proc.pid}")
+                proc.terminate()  # SIGTERM
+
+            gone, alive = psutil.wait_procs(targets, timeout=3)
+            for proc in gone:
+                logger.info(f"Process {proc.pid} terminated successfully")
+            for proc in alive:
+                logger.warning(f"Process {proc.pid} still running, sending SIGKILL")
+                proc.kill()  # SIGKILL
+
+            logger.info("✅ Recording processes terminated")
+            return
+
+        # Fallback without psutil: pgrep plus a serial SIGTERM/SIGKILL loop
+        import subprocess
+        import os
+
         result = subprocess.run(
             ["pgrep", "-f", "start_recording.py"],
             capture_output=True,
             text=True
         )
-        
+
         if result.stdout.strip():
             pids = result.stdout.strip().split('\n')
             for pid in pids:
@@ -74,7 +112,7 @@ def terminate_processes():
                     logger.info(f"Terminating process {pid}")
                     os.kill(int(pid), 15)  # SIGTERM
                     time.sleep(1)
-                    
+
                     # Check if process is still running
                     try:
                         os.kill(int(pid), 0)  # Check if process exists
@@ -82,11 +120,11 @@ def terminate_processes():
                         os.kill(int(pid), 9)  # SIGKILL
                     except OSError:
                         logger.info(f"Process {pid} terminated successfully")
-            
+
             logger.info("✅ Recording processes terminated")
         else:
             logger.info("No recording processes found")
-            
+
     except Exception as e:
         logger.error(f"Error terminating processes: {e}")
 